@@ -102,8 +102,7 @@ class DeltaCalculator:
                         old_config=change.baseline_resource.raw_config,
                         new_config=change.resource.raw_config,
                     )
-                    for diff in diffs:
-                        drift_report.add_diff(diff)
+                    drift_report.add_diffs(diffs)
 
         # Create delta report
         report = DeltaReport(
@@ -2,9 +2,46 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any
 
-from ..models.config_diff import SECURITY_CRITICAL_FIELDS, ChangeCategory, ConfigDiff
+from ..models.config_diff import SECURITY_CRITICAL_RE, ChangeCategory, ConfigDiff
+
+# IAM permission keywords compiled once into a single alternation; matched against lowercased field paths
+_PERMISSIONS_RE = re.compile(
+    "|".join(re.escape(k) for k in ("policy", "permission", "role", "assumerolepolicydocument", "statement"))
+)
+
+
+@lru_cache(maxsize=4096)
+def _categorize_field(field_path: str, is_iam: bool) -> ChangeCategory:
+    """Categorize a field path; cached since the same paths recur across resources.
+
+    Args:
+        field_path: Dot-notation field path
+        is_iam: Whether the resource ARN belongs to IAM
+
+    Returns:
+        ChangeCategory enum value
+    """
+    field_lower = field_path.lower()
+
+    # Check for Tags category
+    if "tags" in field_lower or field_path.startswith("Tags."):
+        return ChangeCategory.TAGS
+
+    # Check for Permissions category (IAM-related) - do this BEFORE security check
+    # because some IAM fields like "Policy" could match security keywords
+    if is_iam and _PERMISSIONS_RE.search(field_lower):
+        return ChangeCategory.PERMISSIONS
+
+    # Check for Security category
+    if SECURITY_CRITICAL_RE.search(field_path):
+        return ChangeCategory.SECURITY
+
+    # Default to Configuration
+    return ChangeCategory.CONFIGURATION
 
 
 class ConfigDiffer:
@@ -33,11 +70,39 @@ class ConfigDiffer:
             new_config: Current configuration
             field_prefix: Dot-notation prefix for nested fields (internal use)
 
+        Returns:
+            List of ConfigDiff objects representing changes
+        """
+        # Lowercase the ARN once per resource rather than once per changed field
+        is_iam = "iam" in resource_arn.lower()
+        return self._compare_dicts(resource_arn, old_config, new_config, field_prefix, is_iam)
+
+    def _compare_dicts(
+        self,
+        resource_arn: str,
+        old_config: dict[str, Any],
+        new_config: dict[str, Any],
+        field_prefix: str,
+        is_iam: bool,
+    ) -> list[ConfigDiff]:
+        """Compare two configuration dictionaries key by key.
+
+        Args:
+            resource_arn: ARN of the resource being compared
+            old_config: Previous configuration
+            new_config: Current configuration
+            field_prefix: Dot-notation prefix for nested fields
+            is_iam: Whether the resource ARN belongs to IAM
+
         Returns:
             List of ConfigDiff objects representing changes
         """
         diffs: list[ConfigDiff] = []
 
+        # Same object on both sides (e.g. a shared sub-dict): nothing can differ
+        if old_config is new_config:
+            return diffs
+
         # Get all unique keys from both configs
         all_keys = set(old_config.keys()) | set(new_config.keys())
 
@@ -47,22 +112,22 @@ class ConfigDiffer:
             old_value = old_config.get(key)
             new_value = new_config.get(key)
 
-            # Skip if values are identical
-            if old_value == new_value:
+            # Skip if values are identical; equal subtrees are pruned here without recursing
+            if old_value is new_value or old_value == new_value:
                 continue
 
             # Recursively compare nested dictionaries
             if isinstance(old_value, dict) and isinstance(new_value, dict):
-                nested_diffs = self.compare(resource_arn, old_value, new_value, field_path)
+                nested_diffs = self._compare_dicts(resource_arn, old_value, new_value, field_path, is_iam)
                 diffs.extend(nested_diffs)
             # Recursively compare lists
             elif isinstance(old_value, list) and isinstance(new_value, list):
-                list_diffs = self._compare_lists(resource_arn, old_value, new_value, field_path)
+                list_diffs = self._compare_lists(resource_arn, old_value, new_value, field_path, is_iam)
                 diffs.extend(list_diffs)
             # Handle nested dict in old but not in new (or vice versa)
             elif isinstance(old_value, dict) and not isinstance(new_value, dict):
                 # Dict was replaced with non-dict or removed
-                category = self._categorize_change(field_path, resource_arn)
+                category = _categorize_field(field_path, is_iam)
                 diff = ConfigDiff(
                     resource_arn=resource_arn,
                     field_path=field_path,
@@ -73,7 +138,7 @@ class ConfigDiffer:
                 diffs.append(diff)
             elif isinstance(new_value, dict) and not isinstance(old_value, dict):
                 # Dict was added or replaced
-                category = self._categorize_change(field_path, resource_arn)
+                category = _categorize_field(field_path, is_iam)
                 diff = ConfigDiff(
                     resource_arn=resource_arn,
                     field_path=field_path,
@@ -84,7 +149,7 @@ class ConfigDiffer:
                 diffs.append(diff)
             else:
                 # Simple value change, addition, or removal
-                category = self._categorize_change(field_path, resource_arn)
+                category = _categorize_field(field_path, is_iam)
                 diff = ConfigDiff(
                     resource_arn=resource_arn,
                     field_path=field_path,
@@ -102,6 +167,7 @@ class ConfigDiffer:
         old_list: list[Any],
         new_list: list[Any],
         field_path: str,
+        is_iam: bool,
     ) -> list[ConfigDiff]:
         """Compare two lists element by element.
 
@@ -110,6 +176,7 @@ class ConfigDiffer:
             old_list: Previous list
             new_list: Current list
             field_path: Field path for the list
+            is_iam: Whether the resource ARN belongs to IAM
 
         Returns:
             List of ConfigDiff objects for list changes
@@ -124,16 +191,16 @@ class ConfigDiffer:
             old_value = old_list[i] if i < len(old_list) else None
             new_value = new_list[i] if i < len(new_list) else None
 
-            if old_value == new_value:
+            if old_value is new_value or old_value == new_value:
                 continue
 
             # Recursively compare nested dicts in lists
             if isinstance(old_value, dict) and isinstance(new_value, dict):
-                nested_diffs = self.compare(resource_arn, old_value, new_value, element_path)
+                nested_diffs = self._compare_dicts(resource_arn, old_value, new_value, element_path, is_iam)
                 diffs.extend(nested_diffs)
             else:
                 # Simple value change
-                category = self._categorize_change(element_path, resource_arn)
+                category = _categorize_field(element_path, is_iam)
                 diff = ConfigDiff(
                     resource_arn=resource_arn,
                     field_path=element_path,
@@ -144,42 +211,3 @@ class ConfigDiffer:
                 diffs.append(diff)
 
         return diffs
-
-    def _categorize_change(self, field_path: str, resource_arn: str) -> ChangeCategory:
-        """Categorize a configuration change based on field path and resource type.
-
-        Args:
-            field_path: Dot-notation field path
-            resource_arn: ARN of the resource
-
-        Returns:
-            ChangeCategory enum value
-        """
-        field_lower = field_path.lower()
-        arn_lower = resource_arn.lower()
-
-        # Check for Tags category
-        if "tags" in field_lower or field_path.startswith("Tags."):
-            return ChangeCategory.TAGS
-
-        # Check for Permissions category (IAM-related) - do this BEFORE security check
-        # because some IAM fields like "Policy" could match security keywords
-        permissions_keywords = [
-            "policy",
-            "permission",
-            "role",
-            "assumerolepolicydocument",
-            "statement",
-        ]
-        if "iam" in arn_lower:
-            # For IAM resources, policy/permission changes are PERMISSIONS
-            if any(keyword in field_lower for keyword in permissions_keywords):
-                return ChangeCategory.PERMISSIONS
-
-        # Check for Security category
-        for security_field in SECURITY_CRITICAL_FIELDS:
-            if security_field.lower() in field_lower:
-                return ChangeCategory.SECURITY
-
-        # Default to Configuration
-        return ChangeCategory.CONFIGURATION
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -48,14 +48,18 @@ class DriftFormatter:
             resource_type_filter: Optional resource type filter (e.g., "ec2")
             region_filter: Optional region filter (e.g., "us-east-1")
         """
-        # Apply filters
-        diffs = report.get_all_diffs()
+        # Apply filters lazily so the report's diffs are copied into a list only once
+        selected: Iterable[ConfigDiff] = report.iter_diffs()
 
+        # Compare against the ARN fields parsed at diff construction, not substrings of the whole ARN
         if resource_type_filter:
-            diffs = [d for d in diffs if resource_type_filter.lower() in d.resource_arn.lower()]
+            service = resource_type_filter.lower()
+            selected = (d for d in selected if d.service == service)
 
         if region_filter:
-            diffs = [d for d in diffs if region_filter in d.resource_arn]
+            selected = (d for d in selected if d.region == region_filter)
+
+        diffs = list(selected)
 
         # Check if there are any changes after filtering
         if not diffs:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from ..models.config_diff import ChangeCategory, ConfigDiff
 
@@ -11,12 +11,21 @@ class DriftReport:
     """Container for configuration drift analysis results.
 
     Stores and organizes ConfigDiff objects representing field-level changes
-    between snapshot versions.
+    between snapshot versions. Diffs are indexed by category, resource, service and
+    region as they are added, so filtered queries and summaries do not rescan the full list.
     """
 
+    __slots__ = ("_diffs", "_by_category", "_by_resource", "_by_service", "_by_region", "_security_critical")
+
     def __init__(self) -> None:
         """Initialize an empty drift report."""
         self._diffs: list[ConfigDiff] = []
+        # Indexes keep first-seen key order, matching a scan of _diffs
+        self._by_category: dict[ChangeCategory, list[ConfigDiff]] = {}
+        self._by_resource: dict[str, list[ConfigDiff]] = {}
+        self._by_service: dict[str, list[ConfigDiff]] = {}
+        self._by_region: dict[str, list[ConfigDiff]] = {}
+        self._security_critical: list[ConfigDiff] = []
 
     @property
     def total_changes(self) -> int:
@@ -29,7 +38,30 @@ class DriftReport:
         Args:
             diff: ConfigDiff to add
         """
-        self._diffs.append(diff)
+        self.add_diffs((diff,))
+
+    def add_diffs(self, diffs: Iterable[ConfigDiff]) -> None:
+        """Add several configuration diffs to the report in one call.
+
+        Args:
+            diffs: ConfigDiffs to add, in order
+        """
+        # Bind the indexes once rather than looking them up on self per diff
+        all_diffs = self._diffs
+        by_category = self._by_category
+        by_resource = self._by_resource
+        by_service = self._by_service
+        by_region = self._by_region
+        security_critical = self._security_critical
+
+        for diff in diffs:
+            all_diffs.append(diff)
+            by_category.setdefault(diff.category, []).append(diff)
+            by_resource.setdefault(diff.resource_arn, []).append(diff)
+            by_service.setdefault(diff.service, []).append(diff)
+            by_region.setdefault(diff.region, []).append(diff)
+            if diff.is_security_critical():
+                security_critical.append(diff)
 
     def get_all_diffs(self) -> list[ConfigDiff]:
         """Get all configuration diffs.
@@ -39,6 +71,25 @@ class DriftReport:
         """
         return self._diffs.copy()
 
+    def iter_diffs(self) -> Iterator[ConfigDiff]:
+        """Iterate over all configuration diffs without copying them.
+
+        Returns:
+            Iterator over all ConfigDiff objects, in insertion order
+        """
+        return iter(self._diffs)
+
+    def iter_diffs_by_category(self, category: ChangeCategory) -> Iterator[ConfigDiff]:
+        """Iterate over diffs of one category without copying them.
+
+        Args:
+            category: ChangeCategory to filter by
+
+        Returns:
+            Iterator over diffs matching the category
+        """
+        return iter(self._by_category.get(category, ()))
+
     def get_diffs_by_category(self, category: ChangeCategory) -> list[ConfigDiff]:
         """Get diffs filtered by change category.
 
@@ -48,7 +99,7 @@ class DriftReport:
         Returns:
             List of diffs matching the category
         """
-        return [d for d in self._diffs if d.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_security_critical_diffs(self) -> list[ConfigDiff]:
         """Get diffs that affect security-critical settings.
@@ -56,7 +107,7 @@ class DriftReport:
         Returns:
             List of security-critical diffs
         """
-        return [d for d in self._diffs if d.is_security_critical()]
+        return self._security_critical.copy()
 
     def get_diffs_by_resource(self, resource_arn: str) -> list[ConfigDiff]:
         """Get diffs for a specific resource ARN.
@@ -67,7 +118,7 @@ class DriftReport:
         Returns:
             List of diffs for the specified resource
         """
-        return [d for d in self._diffs if d.resource_arn == resource_arn]
+        return list(self._by_resource.get(resource_arn, ()))
 
     def get_diffs_by_resource_type(self, resource_type: str) -> list[ConfigDiff]:
         """Get diffs filtered by resource type.
@@ -76,10 +127,9 @@ class DriftReport:
             resource_type: Resource type to filter by (e.g., "ec2", "rds")
 
         Returns:
-            List of diffs matching the resource type (case insensitive)
+            List of diffs whose ARN service field matches the resource type (case insensitive)
         """
-        resource_type_lower = resource_type.lower()
-        return [d for d in self._diffs if resource_type_lower in d.resource_arn.lower()]
+        return list(self._by_service.get(resource_type.lower(), ()))
 
     def get_diffs_by_region(self, region: str) -> list[ConfigDiff]:
         """Get diffs filtered by AWS region.
@@ -88,9 +138,9 @@ class DriftReport:
             region: AWS region (e.g., "us-east-1")
 
         Returns:
-            List of diffs in the specified region
+            List of diffs whose ARN region field matches the region
         """
-        return [d for d in self._diffs if region in d.resource_arn]
+        return list(self._by_region.get(region, ()))
 
     def get_summary(self) -> dict[str, Any]:
         """Generate summary statistics for the drift report.
@@ -98,13 +148,14 @@ class DriftReport:
         Returns:
             Dictionary with total counts by category and security criticality
         """
+        by_category = self._by_category
         return {
             "total_changes": self.total_changes,
-            "tags_count": len(self.get_diffs_by_category(ChangeCategory.TAGS)),
-            "configuration_count": len(self.get_diffs_by_category(ChangeCategory.CONFIGURATION)),
-            "security_count": len(self.get_diffs_by_category(ChangeCategory.SECURITY)),
-            "permissions_count": len(self.get_diffs_by_category(ChangeCategory.PERMISSIONS)),
-            "security_critical_count": len(self.get_security_critical_diffs()),
+            "tags_count": len(by_category.get(ChangeCategory.TAGS, ())),
+            "configuration_count": len(by_category.get(ChangeCategory.CONFIGURATION, ())),
+            "security_count": len(by_category.get(ChangeCategory.SECURITY, ())),
+            "permissions_count": len(by_category.get(ChangeCategory.PERMISSIONS, ())),
+            "security_critical_count": len(self._security_critical),
         }
 
     def group_by_resource(self) -> dict[str, list[ConfigDiff]]:
@@ -113,12 +164,7 @@ class DriftReport:
         Returns:
             Dictionary mapping resource ARN to list of diffs
         """
-        grouped: dict[str, list[ConfigDiff]] = {}
-        for diff in self._diffs:
-            if diff.resource_arn not in grouped:
-                grouped[diff.resource_arn] = []
-            grouped[diff.resource_arn].append(diff)
-        return grouped
+        return {arn: diffs.copy() for arn, diffs in self._by_resource.items()}
 
     def group_by_category(self) -> dict[ChangeCategory, list[ConfigDiff]]:
         """Group diffs by change category.
@@ -126,12 +172,7 @@ class DriftReport:
         Returns:
             Dictionary mapping ChangeCategory to list of diffs
         """
-        grouped: dict[ChangeCategory, list[ConfigDiff]] = {}
-        for diff in self._diffs:
-            if diff.category not in grouped:
-                grouped[diff.category] = []
-            grouped[diff.category].append(diff)
-        return grouped
+        return {category: diffs.copy() for category, diffs in self._by_category.items()}
 
     def has_security_critical_changes(self) -> bool:
         """Check if the report contains any security-critical changes.
@@ -139,7 +180,7 @@ class DriftReport:
         Returns:
             True if there are security-critical changes, False otherwise
         """
-        return len(self.get_security_critical_diffs()) > 0
+        return bool(self._security_critical)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert drift report to dictionary representation.
@@ -150,5 +191,5 @@ class DriftReport:
         return {
             "total_changes": self.total_changes,
             "summary": self.get_summary(),
-            "diffs": [diff.to_dict() for diff in self._diffs],
+            "diffs": list(map(ConfigDiff.to_dict, self._diffs)),
         }
@@ -0,0 +1,9 @@
+"""Python version compatibility helpers shared by the data models."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance __dict__
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
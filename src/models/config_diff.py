@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any
 
+from ._compat import DATACLASS_SLOTS
+
 
 class ChangeCategory(Enum):
     """Categories of configuration changes."""
@@ -16,6 +20,9 @@ class ChangeCategory(Enum):
     PERMISSIONS = "permissions"
 
 
+# Value -> member lookup for deserialization, avoiding the Enum constructor per row
+_CATEGORY_BY_VALUE = {category.value: category for category in ChangeCategory}
+
 # Security-critical field patterns that should be flagged
 SECURITY_CRITICAL_FIELDS = {
     "PubliclyAccessible",
@@ -32,11 +39,30 @@ SECURITY_CRITICAL_FIELDS = {
     "MetadataOptions",
 }
 
+# All security-critical keywords as one case-insensitive alternation, so a field path is scanned once
+SECURITY_CRITICAL_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(SECURITY_CRITICAL_FIELDS)), re.IGNORECASE
+)
+
+
+def _parse_arn(arn: str) -> tuple[str, str]:
+    """Split an ARN into its (lowercased service, region) fields.
+
+    ARNs have the form arn:partition:service:region:account:resource; missing
+    fields come back as empty strings.
+    """
+    parts = arn.split(":", 5)
+    service = parts[2].lower() if len(parts) > 2 else ""
+    region = parts[3] if len(parts) > 3 else ""
+    return service, region
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfigDiff:
     """Represents a field-level configuration change between two resource snapshots.
 
+    Instances are immutable so they can be shared between reports and groupings.
+
     Attributes:
         resource_arn: AWS ARN of the resource that changed
         field_path: Dot-notation path to the changed field (e.g., "Tags.Environment")
@@ -50,6 +76,9 @@ class ConfigDiff:
     old_value: Any
     new_value: Any
     category: ChangeCategory
+    _security_critical: bool = field(default=False, init=False, repr=False, compare=False)
+    _service: str = field(default="", init=False, repr=False, compare=False)
+    _region: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate ConfigDiff fields after initialization."""
@@ -65,6 +94,25 @@ class ConfigDiff:
         if not isinstance(self.category, ChangeCategory):
             raise ValueError(f"Invalid category type: {type(self.category)}. Must be ChangeCategory enum.")
 
+        # The same field paths recur across resources; share one string object per path
+        object.__setattr__(self, "field_path", sys.intern(self.field_path))
+
+        # Fields are immutable, so derived values only need to be computed once
+        object.__setattr__(self, "_security_critical", SECURITY_CRITICAL_RE.search(self.field_path) is not None)
+        service, region = _parse_arn(self.resource_arn)
+        object.__setattr__(self, "_service", service)
+        object.__setattr__(self, "_region", region)
+
+    @property
+    def service(self) -> str:
+        """Get the lowercased service field of the resource ARN (e.g., "ec2")."""
+        return self._service
+
+    @property
+    def region(self) -> str:
+        """Get the region field of the resource ARN (empty for global resources)."""
+        return self._region
+
     def with_path_prefix(self, prefix: str) -> ConfigDiff:
         """Create a new ConfigDiff with a prefix added to the field path.
 
@@ -74,13 +122,8 @@ class ConfigDiff:
         Returns:
             New ConfigDiff instance with prefixed field path
         """
-        return ConfigDiff(
-            resource_arn=self.resource_arn,
-            field_path=f"{prefix}.{self.field_path}",
-            old_value=self.old_value,
-            new_value=self.new_value,
-            category=self.category,
-        )
+        # __post_init__ still runs so the derived security flag reflects the new path
+        return replace(self, field_path=f"{prefix}.{self.field_path}")
 
     def is_security_critical(self) -> bool:
         """Check if this configuration change affects security-related settings.
@@ -88,9 +131,7 @@ class ConfigDiff:
         Returns:
             True if the change is security-critical, False otherwise
         """
-        # Check if field path contains any security-critical keywords
-        field_lower = self.field_path.lower()
-        return any(keyword.lower() in field_lower for keyword in SECURITY_CRITICAL_FIELDS)
+        return self._security_critical
 
     def to_dict(self) -> dict[str, Any]:
         """Convert ConfigDiff to dictionary representation.
@@ -104,7 +145,7 @@ class ConfigDiff:
             "old_value": self.old_value,
             "new_value": self.new_value,
             "category": self.category.value,
-            "security_critical": self.is_security_critical(),
+            "security_critical": self._security_critical,
         }
 
     @classmethod
@@ -121,9 +162,8 @@ class ConfigDiff:
             ValueError: If category value is invalid
         """
         category_str = data.get("category", "").lower()
-        try:
-            category = ChangeCategory(category_str)
-        except ValueError:
+        category = _CATEGORY_BY_VALUE.get(category_str)
+        if category is None:
             raise ValueError(f"Invalid category value: {category_str}")
 
         return cls(
@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from ..utils.hash import compute_config_hash
+from ._compat import DATACLASS_SLOTS
 
+# EFS file system ID format, compiled once rather than on every validate() call
+_FILE_SYSTEM_ID_RE = re.compile(r"^fs-[a-fA-F0-9]+$")
 
-@dataclass
+# Accepted performance modes and lifecycle states, in documented order for error messages
+_PERFORMANCE_MODES = ("generalPurpose", "maxIO")
+_LIFECYCLE_STATES = ("available", "creating", "deleting", "deleted")
+
+# The same values as sets for constant-time membership checks
+_VALID_PERFORMANCE_MODES = frozenset(_PERFORMANCE_MODES)
+_VALID_LIFECYCLE_STATES = frozenset(_LIFECYCLE_STATES)
+
+# Interned once so every resource dict shares one resource_type string object
+_RESOURCE_TYPE = sys.intern("efs:file-system")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class EFSFileSystem:
     """Represents an AWS EFS file system."""
 
@@ -31,22 +47,20 @@ class EFSFileSystem:
             True if valid, raises ValueError if invalid
         """
         # Validate file_system_id format (must start with fs-)
-        if not re.match(r"^fs-[a-fA-F0-9]+$", self.file_system_id):
+        if not _FILE_SYSTEM_ID_RE.match(self.file_system_id):
             raise ValueError(f"Invalid file_system_id format: {self.file_system_id}. Must match pattern: fs-*")
 
         # Validate performance_mode
-        valid_performance_modes = ["generalPurpose", "maxIO"]
-        if self.performance_mode not in valid_performance_modes:
+        if self.performance_mode not in _VALID_PERFORMANCE_MODES:
             raise ValueError(
                 f"Invalid performance_mode: {self.performance_mode}. "
-                f"Must be one of: {', '.join(valid_performance_modes)}"
+                f"Must be one of: {', '.join(_PERFORMANCE_MODES)}"
             )
 
         # Validate lifecycle_state
-        valid_states = ["available", "creating", "deleting", "deleted"]
-        if self.lifecycle_state not in valid_states:
+        if self.lifecycle_state not in _VALID_LIFECYCLE_STATES:
             raise ValueError(
-                f"Invalid lifecycle_state: {self.lifecycle_state}. " f"Must be one of: {', '.join(valid_states)}"
+                f"Invalid lifecycle_state: {self.lifecycle_state}. " f"Must be one of: {', '.join(_LIFECYCLE_STATES)}"
             )
 
         return True
@@ -70,7 +84,7 @@ class EFSFileSystem:
 
         return {
             "arn": self.arn,
-            "resource_type": "efs:file-system",
+            "resource_type": _RESOURCE_TYPE,
             "name": self.file_system_id,
             "region": self.region,
             "tags": self.tags,
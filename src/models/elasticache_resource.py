@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from ..utils.hash import compute_config_hash
+from ._compat import DATACLASS_SLOTS
 
+# Supported cache engines
+_VALID_ENGINES = frozenset({"redis", "memcached"})
 
-@dataclass
+# resource_type for every cluster dict, interned like ConfigDiff.field_path
+_RESOURCE_TYPE = sys.intern("elasticache:cluster")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ElastiCacheCluster:
     """Represents an AWS ElastiCache cluster (Redis or Memcached).
 
@@ -38,6 +46,10 @@ class ElastiCacheCluster:
     encryption_in_transit: bool
     tags: Dict[str, str] = field(default_factory=dict)
     region: str = "us-east-1"
+    # (raw_config values, hash) from the last config_hash computation
+    _config_hash_cache: Optional[Tuple[Tuple[Any, ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate ElastiCache cluster data after initialization."""
@@ -46,7 +58,7 @@ class ElastiCacheCluster:
             raise ValueError("cluster_id must be 50 characters or less")
 
         # Validate engine type
-        if self.engine not in ("redis", "memcached"):
+        if self.engine not in _VALID_ENGINES:
             raise ValueError("engine must be 'redis' or 'memcached'")
 
         # Memcached does not support encryption at rest
@@ -57,14 +69,9 @@ class ElastiCacheCluster:
         if self.num_cache_nodes < 1:
             raise ValueError("num_cache_nodes must be at least 1")
 
-    def to_resource_dict(self) -> Dict[str, Any]:
-        """Convert ElastiCache cluster to Resource dictionary.
-
-        Returns:
-            Dictionary with Resource fields suitable for creating a Resource object
-        """
-        # Build raw_config that matches ElastiCache API response structure
-        raw_config = {
+    def _raw_config(self) -> Dict[str, Any]:
+        """Build raw_config matching the ElastiCache API response structure."""
+        return {
             "CacheClusterId": self.cluster_id,
             "ARN": self.arn,
             "Engine": self.engine,
@@ -76,15 +83,36 @@ class ElastiCacheCluster:
             "CacheClusterStatus": "available",
         }
 
-        # Compute config hash from raw_config
-        config_hash = compute_config_hash(raw_config)
+    def _hash_raw_config(self, raw_config: Dict[str, Any]) -> str:
+        """Return the config hash of raw_config, reusing the last one if no value changed.
+
+        The dataclass is mutable, so the cache is keyed on the raw_config values
+        rather than held for the lifetime of the instance.
+        """
+        key = tuple(raw_config.values())
+        if self._config_hash_cache is None or self._config_hash_cache[0] != key:
+            self._config_hash_cache = (key, compute_config_hash(raw_config))
+        return self._config_hash_cache[1]
+
+    @property
+    def config_hash(self) -> str:
+        """SHA256 hash of raw_config, recomputed only when a hashed field changes."""
+        return self._hash_raw_config(self._raw_config())
+
+    def to_resource_dict(self) -> Dict[str, Any]:
+        """Convert ElastiCache cluster to Resource dictionary.
+
+        Returns:
+            Dictionary with Resource fields suitable for creating a Resource object
+        """
+        raw_config = self._raw_config()
 
         return {
             "arn": self.arn,
-            "resource_type": "elasticache:cluster",
+            "resource_type": _RESOURCE_TYPE,
             "name": self.cluster_id,
             "region": self.region,
             "tags": self.tags,
-            "config_hash": config_hash,
+            "config_hash": self._hash_raw_config(raw_config),
             "raw_config": raw_config,
         }
@@ -7,7 +7,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+from ._compat import DATACLASS_SLOTS
 
 
 class RuleType(Enum):
@@ -20,7 +22,12 @@ class RuleType(Enum):
     NATIVE = "native"
 
 
-@dataclass
+# Pattern keys holding collections of allowed values, only ever used for membership checks
+_SET_PATTERN_KEYS = ("tag_values", "resource_types", "protection_types")
+_COLLECTION_TYPES = (list, tuple, set, frozenset)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProtectionRule:
     """Protection rule entity.
 
@@ -40,6 +47,9 @@ class ProtectionRule:
         - NATIVE: Check AWS native protection flags
             patterns: {protection_types: list}
 
+    The tag_values, resource_types and protection_types lists are stored as
+    frozensets, so membership checks in matches() are hash lookups.
+
     Validation rules:
         - patterns cannot be empty
         - priority must be 1-100
@@ -63,6 +73,21 @@ class ProtectionRule:
     threshold_value: Optional[float] = None
     description: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Store value-list patterns as frozensets, without modifying the caller's dict.
+
+        A lone string is treated as a one-value list; any other value is kept as given.
+        """
+        set_patterns = {}
+        for key in _SET_PATTERN_KEYS:
+            value = self.patterns.get(key)
+            if isinstance(value, _COLLECTION_TYPES):
+                set_patterns[key] = frozenset(value)
+            elif isinstance(value, str):
+                set_patterns[key] = frozenset((value,))
+        if set_patterns:
+            self.patterns = {**self.patterns, **set_patterns}
+
     def validate(self) -> bool:
         """Validate rule configuration.
 
@@ -99,22 +124,37 @@ class ProtectionRule:
         if not self.enabled:
             return False
 
-        if self.rule_type == RuleType.TAG:
-            tag_key = self.patterns.get("tag_key")
-            tag_values = self.patterns.get("tag_values", [])
-            resource_tag_value = resource.get("tags", {}).get(tag_key)
-            return resource_tag_value in tag_values
-
-        elif self.rule_type == RuleType.TYPE:
-            resource_types = self.patterns.get("resource_types", [])
-            return resource.get("resource_type") in resource_types
-
-        elif self.rule_type == RuleType.AGE:
-            resource_age_days = resource.get("age_days", 0)
-            return resource_age_days < self.threshold_value
-
-        elif self.rule_type == RuleType.COST:
-            resource_cost = resource.get("estimated_monthly_cost", 0)
-            return resource_cost >= self.threshold_value
-
-        return False
+        matcher = _MATCHERS.get(self.rule_type)
+        return matcher(self, resource) if matcher is not None else False
+
+    def _match_tag(self, resource: dict) -> bool:
+        """Match resources whose tag_key tag has one of the tag_values."""
+        tag_key = self.patterns.get("tag_key")
+        tag_values = self.patterns.get("tag_values", frozenset())
+        resource_tag_value = resource.get("tags", {}).get(tag_key)
+        return resource_tag_value in tag_values
+
+    def _match_type(self, resource: dict) -> bool:
+        """Match resources whose type is one of resource_types."""
+        resource_types = self.patterns.get("resource_types", frozenset())
+        return resource.get("resource_type") in resource_types
+
+    def _match_age(self, resource: dict) -> bool:
+        """Match resources younger than threshold_value days."""
+        resource_age_days = resource.get("age_days", 0)
+        return resource_age_days < self.threshold_value
+
+    def _match_cost(self, resource: dict) -> bool:
+        """Match resources costing at least threshold_value USD/month."""
+        resource_cost = resource.get("estimated_monthly_cost", 0)
+        return resource_cost >= self.threshold_value
+
+
+# Matcher per rule type, looked up once per matches() call instead of comparing against each type;
+# NATIVE rules have no matcher here and never match
+_MATCHERS: Dict[RuleType, Callable[[ProtectionRule, dict], bool]] = {
+    RuleType.TAG: ProtectionRule._match_tag,
+    RuleType.TYPE: ProtectionRule._match_type,
+    RuleType.AGE: ProtectionRule._match_age,
+    RuleType.COST: ProtectionRule._match_cost,
+}
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from src.models.protection_rule import ProtectionRule
+from src.models.protection_rule import ProtectionRule, RuleType
 
 
 class SafetyChecker:
@@ -17,6 +17,13 @@ class SafetyChecker:
     they should be protected from deletion. Supports multiple rule types
     (tag, type, age, cost, native) with priority-based evaluation.
 
+    TAG rules are indexed by tag key and value whenever ``rules`` is assigned,
+    so matching a resource costs one lookup per resource tag regardless of how
+    many TAG rules are configured. Other rule types are evaluated one by one.
+    Rule ``enabled`` flags are read at check time, but changing a rule's
+    patterns or type in place, or mutating the ``rules`` list itself, needs a
+    reassignment of ``rules`` to refresh the index.
+
     Attributes:
         rules: List of protection rules sorted by priority
     """
@@ -27,7 +34,35 @@ class SafetyChecker:
         Args:
             rules: List of protection rules (sorted by priority, 1=highest)
         """
-        self.rules = sorted(rules, key=lambda r: r.priority)
+        self.rules = rules
+
+    @property
+    def rules(self) -> list[ProtectionRule]:
+        """Protection rules sorted by priority (1=highest)."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list[ProtectionRule]) -> None:
+        """Sort the rules by priority and rebuild the TAG rule index."""
+        self._rules = sorted(rules, key=lambda r: r.priority)
+
+        # tag_key -> tag value -> positions in self.rules of TAG rules accepting it
+        self._tag_index: dict[str, dict[str, list[int]]] = {}
+        # Positions of rules not in the tag index, in priority order
+        self._other_positions: list[int] = []
+        for position, rule in enumerate(self._rules):
+            if rule.rule_type == RuleType.TAG:
+                tag_key = rule.patterns.get("tag_key")
+                if tag_key is None:
+                    continue  # Matches no tag, so never matches a resource
+                tag_values = rule.patterns.get("tag_values", frozenset())
+                if isinstance(tag_values, frozenset):
+                    values = self._tag_index.setdefault(tag_key, {})
+                    for value in tag_values:
+                        values.setdefault(value, []).append(position)
+                    continue
+            # Non-TAG rules, and TAG rules whose tag_values are not a value set, go through matches()
+            self._other_positions.append(position)
 
     def is_protected(self, resource: dict) -> tuple[bool, Optional[str]]:
         """Check if resource is protected by any rule.
@@ -43,15 +78,22 @@ class SafetyChecker:
                 is_protected: True if resource matches any protection rule
                 reason: Human-readable reason for protection, None if not protected
         """
-        for rule in self.rules:
-            if not rule.enabled:
-                continue
+        first = min(self._tag_rule_matches(resource), default=len(self.rules))
+
+        # Only non-TAG rules with higher priority than the best TAG match can win
+        for position in self._other_positions:
+            if position >= first:
+                break
+            rule = self.rules[position]
+            if rule.enabled and rule.matches(resource):
+                first = position
+                break
 
-            if rule.matches(resource):
-                reason = self._get_protection_reason(rule, resource)
-                return True, reason
+        if first == len(self.rules):
+            return False, None
 
-        return False, None
+        rule = self.rules[first]
+        return True, self._get_protection_reason(rule, resource)
 
     def check_all_protections(self, resource: dict) -> list[ProtectionRule]:
         """Check which protection rules match a resource.
@@ -65,16 +107,34 @@ class SafetyChecker:
         Returns:
             List of all matching protection rules
         """
-        matching_rules = []
+        positions = self._tag_rule_matches(resource)
+
+        for position in self._other_positions:
+            rule = self.rules[position]
+            if rule.enabled and rule.matches(resource):
+                positions.add(position)
+
+        return [self.rules[position] for position in sorted(positions)]
+
+    def _tag_rule_matches(self, resource: dict) -> set[int]:
+        """Find the enabled TAG rules matching a resource via the tag index.
 
-        for rule in self.rules:
-            if not rule.enabled:
-                continue
+        Args:
+            resource: Resource metadata dictionary
+
+        Returns:
+            Positions in self.rules of the matching TAG rules
+        """
+        positions: set[int] = set()
+        if not self._tag_index:
+            return positions
 
-            if rule.matches(resource):
-                matching_rules.append(rule)
+        for tag_key, tag_value in (resource.get("tags") or {}).items():
+            values = self._tag_index.get(tag_key)
+            if values:
+                positions.update(p for p in values.get(tag_value, ()) if self.rules[p].enabled)
 
-        return matching_rules
+        return positions
 
     def _get_protection_reason(self, rule: ProtectionRule, resource: dict) -> str:
         """Generate human-readable protection reason.
@@ -92,7 +152,7 @@ class SafetyChecker:
         # Generate default reason based on rule type
         if rule.rule_type.value == "tag":
             tag_key = rule.patterns.get("tag_key", "")
-            resource_tag_value = resource.get("tags", {}).get(tag_key, "")
+            resource_tag_value = (resource.get("tags") or {}).get(tag_key, "")
             return f"Tag {tag_key}={resource_tag_value} (rule: {rule.rule_id})"
 
         elif rule.rule_type.value == "type":
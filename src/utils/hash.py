@@ -19,6 +19,10 @@ EXCLUDE_ATTRIBUTES: Set[str] = {
     "ModifiedTime",
 }
 
+# Same settings as json.dumps(..., sort_keys=True, default=str), so hashes stored in existing
+# snapshots stay valid; built once instead of json.dumps constructing an encoder per call
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
 
 def compute_config_hash(resource_data: Dict[str, Any]) -> str:
     """Compute stable SHA256 hash of resource configuration.
@@ -36,7 +40,7 @@ def compute_config_hash(resource_data: Dict[str, Any]) -> str:
     clean_data = _remove_volatile_attributes(resource_data, EXCLUDE_ATTRIBUTES)
 
     # Normalize: sort keys for deterministic JSON
-    normalized = json.dumps(clean_data, sort_keys=True, default=str)
+    normalized = _CANONICAL_ENCODER.encode(clean_data)
 
     # Hash
     return hashlib.sha256(normalized.encode()).hexdigest()
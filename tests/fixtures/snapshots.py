@@ -362,3 +362,18 @@ def create_mock_snapshot(
         resources=resources,
         schema_version="1.1",
     )
+
+
+def group_resources_by_type(snapshot: Snapshot) -> Dict[str, List[Resource]]:
+    """Index a snapshot's resources by resource type in a single pass.
+
+    Args:
+        snapshot: Snapshot whose resources to group
+
+    Returns:
+        Resources keyed by resource type, in snapshot order
+    """
+    grouped: Dict[str, List[Resource]] = {}
+    for resource in snapshot.resources:
+        grouped.setdefault(resource.resource_type, []).append(resource)
+    return grouped
@@ -0,0 +1,72 @@
+"""Shared fixtures for integration tests."""
+
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from src.snapshot.storage import SnapshotStorage
+from tests.fixtures.snapshots import (
+    create_ec2_instance,
+    create_iam_user,
+    create_mock_snapshot,
+    create_rds_instance,
+    create_s3_bucket,
+    create_secrets_manager_secret,
+    create_security_group,
+)
+
+
+@pytest.fixture(scope="session")
+def test_snapshot_with_issues(tmp_path_factory: pytest.TempPathFactory) -> Tuple[str, Path]:
+    """Create a test snapshot with known security issues (written once per session)."""
+    storage_dir = tmp_path_factory.mktemp("scan-issues")
+
+    # Create snapshot with various security issues
+    public_bucket = create_s3_bucket("public-test-bucket", public=True)
+    open_sg_ssh = create_security_group("sg-ssh", open_ports=[22])
+    open_sg_db = create_security_group("sg-db", open_ports=[3306, 5432])
+    public_db = create_rds_instance("public-database", publicly_accessible=True, encrypted=False)
+    imdsv1_instance = create_ec2_instance("old-instance", imdsv2_required=False)
+    old_credentials = create_iam_user("old-user", access_key_age_days=120)
+    old_secret = create_secrets_manager_secret("old-secret", last_rotated_days_ago=150)
+
+    snapshot = create_mock_snapshot(
+        name="test-with-issues",
+        resources=[
+            public_bucket,
+            open_sg_ssh,
+            open_sg_db,
+            public_db,
+            imdsv1_instance,
+            old_credentials,
+            old_secret,
+        ],
+    )
+
+    # Save snapshot
+    storage = SnapshotStorage(storage_dir)
+    storage.save_snapshot(snapshot)
+
+    return "test-with-issues", storage_dir
+
+
+@pytest.fixture(scope="session")
+def test_snapshot_clean(tmp_path_factory: pytest.TempPathFactory) -> Tuple[str, Path]:
+    """Create a test snapshot with no security issues (written once per session)."""
+    storage_dir = tmp_path_factory.mktemp("scan-clean")
+
+    private_bucket = create_s3_bucket("private-bucket", public=False, encrypted=True)
+    closed_sg = create_security_group("sg-closed", open_ports=[])
+    private_db = create_rds_instance("private-db", publicly_accessible=False, encrypted=True)
+    imdsv2_instance = create_ec2_instance("new-instance", imdsv2_required=True)
+
+    snapshot = create_mock_snapshot(
+        name="test-clean",
+        resources=[private_bucket, closed_sg, private_db, imdsv2_instance],
+    )
+
+    storage = SnapshotStorage(storage_dir)
+    storage.save_snapshot(snapshot)
+
+    return "test-clean", storage_dir
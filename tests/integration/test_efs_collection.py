@@ -10,6 +10,9 @@ import pytest
 
 from src.snapshot.capturer import create_snapshot
 from src.snapshot.storage import SnapshotStorage
+from tests.fixtures.snapshots import group_resources_by_type
+
+pytestmark = pytest.mark.xdist_group("aws_mocks")
 
 
 @pytest.fixture
@@ -96,7 +99,7 @@ class TestEFSIntegration:
         )
 
         # Verify EFS resources were collected
-        efs_resources = [r for r in snapshot.resources if r.resource_type == "efs:file-system"]
+        efs_resources = group_resources_by_type(snapshot).get("efs:file-system", [])
         assert len(efs_resources) == 2
 
         # Verify first EFS file system
@@ -171,7 +174,7 @@ class TestEFSIntegration:
         )
 
         # Should only have 1 EFS (the prod one)
-        efs_resources = [r for r in snapshot.resources if r.resource_type == "efs:file-system"]
+        efs_resources = group_resources_by_type(snapshot).get("efs:file-system", [])
         assert len(efs_resources) == 1
         assert efs_resources[0].tags["Environment"] == "prod"
 
@@ -186,45 +189,14 @@ class TestEFSIntegration:
         """Test that delta tracking identifies new EFS file systems."""
         from src.delta.calculator import DeltaCalculator
 
-        # Mock for baseline snapshot (no EFS)
-        def mock_client_no_efs(service_name: str, region_name: str = "us-east-1", profile_name: str = None):  # type: ignore
-            if service_name == "efs":
-                client = MagicMock()
-                paginator = MagicMock()
-                paginator.paginate.return_value = [{"FileSystems": []}]
-                client.get_paginator.return_value = paginator
-                return client
-            elif service_name == "sts":
-                client = MagicMock()
-                client.get_caller_identity.return_value = {"Account": "123456789012"}
-                return client
-            else:
-                client = MagicMock()
-                client.get_paginator.side_effect = Exception("Service not mocked")
-                return client
+        # Single client factory; the EFS payload is swapped between snapshots
+        payload: dict = {"FileSystems": []}
 
-        # Mock for new snapshot (with EFS)
-        def mock_client_with_efs(service_name: str, region_name: str = "us-east-1", profile_name: str = None):  # type: ignore
+        def mock_client(service_name: str, region_name: str = "us-east-1", profile_name: str = None):  # type: ignore
             if service_name == "efs":
                 client = MagicMock()
                 paginator = MagicMock()
-                paginator.paginate.return_value = [
-                    {
-                        "FileSystems": [
-                            {
-                                "FileSystemId": "fs-new-001",
-                                "FileSystemArn": (
-                                    "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-new-001"
-                                ),
-                                "CreationTime": datetime.now(timezone.utc),
-                                "LifeCycleState": "available",
-                                "PerformanceMode": "generalPurpose",
-                                "Encrypted": True,
-                                "Tags": [],
-                            }
-                        ]
-                    }
-                ]
+                paginator.paginate.return_value = [{"FileSystems": payload["FileSystems"]}]
                 client.get_paginator.return_value = paginator
                 return client
             elif service_name == "sts":
@@ -236,12 +208,13 @@ class TestEFSIntegration:
                 client.get_paginator.side_effect = Exception("Service not mocked")
                 return client
 
+        mock_create_boto_client.side_effect = mock_client
+
         session_instance = MagicMock()
         session_instance.profile_name = "test-profile"
         mock_session.return_value = session_instance
 
         # Create baseline snapshot (no EFS)
-        mock_create_boto_client.side_effect = mock_client_no_efs
         baseline = create_snapshot(
             name="baseline",
             regions=["us-east-1"],
@@ -256,7 +229,17 @@ class TestEFSIntegration:
         storage.save_snapshot(baseline)
 
         # Create new snapshot (with EFS)
-        mock_create_boto_client.side_effect = mock_client_with_efs
+        payload["FileSystems"] = [
+            {
+                "FileSystemId": "fs-new-001",
+                "FileSystemArn": "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-new-001",
+                "CreationTime": datetime.now(timezone.utc),
+                "LifeCycleState": "available",
+                "PerformanceMode": "generalPurpose",
+                "Encrypted": True,
+                "Tags": [],
+            }
+        ]
         current = create_snapshot(
             name="current",
             regions=["us-east-1"],
@@ -343,7 +326,7 @@ class TestEFSIntegration:
         loaded_snapshot = storage.load_snapshot("test-efs-persist")
 
         # Verify EFS resources persisted correctly
-        efs_resources = [r for r in loaded_snapshot.resources if r.resource_type == "efs:file-system"]
+        efs_resources = group_resources_by_type(loaded_snapshot).get("efs:file-system", [])
         assert len(efs_resources) == 2
 
         # Verify raw_config persisted
@@ -8,6 +8,9 @@ import pytest
 
 from src.security.scanner import SecurityScanner
 from src.snapshot.capturer import create_snapshot
+from tests.fixtures.snapshots import group_resources_by_type
+
+pytestmark = pytest.mark.xdist_group("aws_mocks")
 
 
 @pytest.fixture
@@ -65,6 +68,12 @@ def mock_boto_clients_for_elasticache(mock_elasticache_clusters: list[dict]) ->
     return mock_create_client
 
 
+@pytest.fixture(scope="module")
+def security_scanner() -> SecurityScanner:
+    """Shared scanner; checks are loaded once and hold no per-scan state."""
+    return SecurityScanner()
+
+
 class TestElastiCacheCollectionIntegration:
     """Integration tests for ElastiCache collection and security scanning."""
 
@@ -95,7 +104,7 @@ class TestElastiCacheCollectionIntegration:
         )
 
         # Verify ElastiCache resources were collected
-        elasticache_resources = [r for r in snapshot.resources if r.resource_type == "elasticache:cluster"]
+        elasticache_resources = group_resources_by_type(snapshot).get("elasticache:cluster", [])
         assert len(elasticache_resources) == 2
 
         # Verify Redis cluster
@@ -149,6 +158,7 @@ class TestElastiCacheCollectionIntegration:
         self,
         mock_session: Mock,
         mock_create_boto_client: Mock,
+        security_scanner: SecurityScanner,
     ) -> None:
         """Test that security scanner detects unencrypted ElastiCache clusters."""
 
@@ -198,8 +208,7 @@ class TestElastiCacheCollectionIntegration:
         )
 
         # Run security scanner
-        scanner = SecurityScanner()
-        scan_results = scanner.scan(snapshot)
+        scan_results = security_scanner.scan(snapshot)
 
         # Verify security findings for unencrypted ElastiCache
         elasticache_findings = [f for f in scan_results.findings if "elasticache" in f.finding_type.lower()]
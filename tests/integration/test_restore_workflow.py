@@ -5,117 +5,236 @@ End-to-end tests for resource cleanup/restoration functionality.
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from src.models.deletion_operation import OperationMode, OperationStatus
+from src.models.protection_rule import ProtectionRule, RuleType
+from src.models.resource import Resource
+from src.models.snapshot import Snapshot
 from src.restore.audit import AuditStorage
-from src.restore.cleaner import ResourceCleaner
 from src.restore.safety import SafetyChecker
 from src.snapshot.storage import SnapshotStorage
 
+if TYPE_CHECKING:
+    from src.restore.cleaner import ResourceCleaner
+
+pytestmark = pytest.mark.xdist_group("restore_integration")
+
+# Baseline the cleaner compares against; tests only read it
+_BASELINE_SNAPSHOT = Snapshot(
+    name="baseline-test",
+    created_at=datetime(2025, 11, 1, 10, 0, 0),
+    account_id="123456789012",
+    regions=["us-east-1"],
+    resources=[
+        Resource(
+            arn="arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
+            resource_type="AWS::EC2::VPC",
+            name="vpc-baseline",
+            region="us-east-1",
+            config_hash="baseline_config_hash",
+            tags={},
+        )
+    ],
+    resource_count=1,
+)
+
+# Every resource any test reports as currently deployed; tests select by resource_id
+ALL_RESOURCES: tuple[dict, ...] = (
+    {
+        "resource_id": "vpc-baseline",
+        "resource_type": "AWS::EC2::VPC",
+        "region": "us-east-1",
+        "arn": "arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
+        "tags": {},
+    },
+    {
+        "resource_id": "i-new-001",
+        "resource_type": "AWS::EC2::Instance",
+        "region": "us-east-1",
+        "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-new-001",
+        "tags": {"Environment": "test", "CreatedBy": "integration-test"},
+    },
+    {
+        "resource_id": "i-new-002",
+        "resource_type": "AWS::EC2::Instance",
+        "region": "us-east-1",
+        "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-new-002",
+        "tags": {"Environment": "dev"},
+    },
+    {
+        "resource_id": "bucket-001",
+        "resource_type": "AWS::S3::Bucket",
+        "region": "us-east-1",
+        "arn": "arn:aws:s3:::bucket-001",
+        "tags": {},
+    },
+    {
+        "resource_id": "i-protected",
+        "resource_type": "AWS::EC2::Instance",
+        "region": "us-east-1",
+        "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-protected",
+        "tags": {"Protection": "true"},
+    },
+    {
+        "resource_id": "i-deletable",
+        "resource_type": "AWS::EC2::Instance",
+        "region": "us-east-1",
+        "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-deletable",
+        "tags": {"Environment": "test"},
+    },
+)
+
+PROTECT_TAG_RULE = ProtectionRule(
+    rule_id="rule_001",
+    rule_type=RuleType.TAG,
+    enabled=True,
+    priority=1,
+    patterns={
+        "tag_key": "Protection",
+        "tag_values": ["true", "critical"],
+    },
+    description="Protect tagged resources",
+)
+
+
+def _current_resources(*resource_ids: str) -> list[dict]:
+    """Select the current-state resources for a test from ALL_RESOURCES."""
+    wanted = set(resource_ids)
+    return [r for r in ALL_RESOURCES if r["resource_id"] in wanted]
+
+
+class _StubCleanerMixin:
+    """Replaces ResourceCleaner's AWS-facing hooks with in-memory fakes.
+
+    Tests set ``stub_resources`` to the current account state and read
+    ``deleted`` to see which resources the cleaner tried to remove.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stub_resources: list[dict] = []
+        self.deleted: list[dict] = []
+
+    def _collect_current_resources(self, *args: Any, **kwargs: Any) -> list[dict]:
+        return self.stub_resources
+
+    def _delete_resource(self, resource: dict, *args: Any, **kwargs: Any) -> bool:
+        self.deleted.append(resource)
+        return True
+
+
+@functools.lru_cache(maxsize=None)
+def _stub_cleaner_class() -> type[ResourceCleaner]:
+    """Build the stubbed cleaner class on first use (keeps the cleaner import lazy)."""
+    from src.restore.cleaner import ResourceCleaner
+
+    return type("StubResourceCleaner", (_StubCleanerMixin, ResourceCleaner), {})
+
 
 class TestRestoreWorkflowIntegration:
     """Integration tests for restore workflow (US1 - Preview)."""
 
-    @pytest.fixture
-    def temp_storage_dir(self, tmp_path: Path) -> Path:
-        """Create temporary storage directory."""
-        storage_dir = tmp_path / ".snapshots"
-        storage_dir.mkdir(parents=True)
-        return storage_dir
+    @pytest.fixture(scope="session")
+    def temp_storage_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Temporary storage directory shared by the whole session.
 
-    @pytest.fixture
+        Not created here; SnapshotStorage and AuditStorage create it on init.
+        """
+        return tmp_path_factory.mktemp("restore") / ".snapshots"
+
+    @pytest.fixture(scope="session")
     def snapshot_storage(self, temp_storage_dir: Path) -> SnapshotStorage:
-        """Create snapshot storage with test data."""
-        from src.models.resource import Resource
-        from src.models.snapshot import Snapshot
+        """Create snapshot storage with test data.
 
+        Tests only read the baseline, so it is written once per session.
+        """
         storage = SnapshotStorage(storage_dir=str(temp_storage_dir))
 
-        # Create baseline snapshot with Resource objects
-        resources = [
-            Resource(
-                arn="arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
-                resource_type="AWS::EC2::VPC",
-                name="vpc-baseline",
-                region="us-east-1",
-                config_hash="baseline_config_hash",
-                tags={},
-            )
-        ]
-
-        baseline_snapshot = Snapshot(
-            name="baseline-test",
-            created_at=datetime(2025, 11, 1, 10, 0, 0),
-            account_id="123456789012",
-            regions=["us-east-1"],
-            resources=resources,
-            resource_count=1,
-        )
-
         # Save baseline snapshot using storage
-        storage.save_snapshot(baseline_snapshot)
+        storage.save_snapshot(_BASELINE_SNAPSHOT)
 
         return storage
 
     @pytest.fixture
-    def audit_storage(self, temp_storage_dir: Path) -> AuditStorage:
-        """Create audit storage."""
-        return AuditStorage(storage_dir=str(temp_storage_dir / "audit-logs"))
+    def audit_storage(self, tmp_path: Path) -> AuditStorage:
+        """Create audit storage per test, since execute tests write audit logs."""
+        return AuditStorage(storage_dir=str(tmp_path / "audit-logs"))
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def safety_checker(self) -> SafetyChecker:
         """Create safety checker with no rules."""
         return SafetyChecker(rules=[])
 
-    def test_preview_workflow_end_to_end(
+    @pytest.fixture
+    def cleaner(
         self,
         snapshot_storage: SnapshotStorage,
         audit_storage: AuditStorage,
         safety_checker: SafetyChecker,
-    ) -> None:
-        """Test complete preview workflow from snapshot to operation result."""
-        cleaner = ResourceCleaner(
+    ) -> ResourceCleaner:
+        """Create a stubbed resource cleaner over the shared baseline storage."""
+        return _stub_cleaner_class()(
             snapshot_storage=snapshot_storage,
             safety_checker=safety_checker,
             audit_storage=audit_storage,
         )
 
-        # Mock current resources (baseline + new resources)
-        current_resources = [
-            {
-                "resource_id": "vpc-baseline",
-                "resource_type": "AWS::EC2::VPC",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
-                "tags": {},
-            },
-            {
-                "resource_id": "i-new-001",
-                "resource_type": "AWS::EC2::Instance",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-new-001",
-                "tags": {"Environment": "test", "CreatedBy": "integration-test"},
-            },
-            {
-                "resource_id": "i-new-002",
-                "resource_type": "AWS::EC2::Instance",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-new-002",
-                "tags": {"Environment": "dev"},
-            },
-        ]
-
-        # Mock resource collection
-        with patch.object(cleaner, "_collect_current_resources", return_value=current_resources):
-            operation = cleaner.preview(
-                baseline_snapshot="baseline-test",
-                account_id="123456789012",
-            )
+    @pytest.mark.parametrize(
+        "resource_ids,rules,preview_kwargs,expected",
+        [
+            pytest.param(
+                ("vpc-baseline", "i-new-001", "i-new-002"),
+                [],
+                {},
+                {"total_resources": 2, "succeeded_count": 0, "failed_count": 0, "skipped_count": 0},
+                id="end_to_end",
+            ),
+            pytest.param(
+                ("vpc-baseline", "i-new-001", "bucket-001"),
+                [],
+                {"resource_types": ["AWS::EC2::Instance"], "regions": ["us-east-1"]},
+                {
+                    # Should only include EC2 instances in us-east-1
+                    "total_resources": 1,
+                    "filters": {"resource_types": ["AWS::EC2::Instance"], "regions": ["us-east-1"]},
+                },
+                id="with_filters",
+            ),
+            pytest.param(
+                ("vpc-baseline", "i-protected", "i-deletable"),
+                [PROTECT_TAG_RULE],
+                {},
+                # Should identify 2 new resources, 1 protected
+                {"total_resources": 2, "skipped_count": 1},
+                id="with_protection_rules",
+            ),
+        ],
+    )
+    def test_preview(
+        self,
+        cleaner: ResourceCleaner,
+        resource_ids: tuple[str, ...],
+        rules: list[ProtectionRule],
+        preview_kwargs: dict,
+        expected: dict,
+    ) -> None:
+        """Test preview workflow from snapshot to operation result."""
+        if rules:
+            cleaner.safety_checker = SafetyChecker(rules=rules)
+
+        # Mock resource collection (baseline + new resources)
+        cleaner.stub_resources = _current_resources(*resource_ids)
+        operation = cleaner.preview(
+            baseline_snapshot="baseline-test",
+            account_id="123456789012",
+            **preview_kwargs,
+        )
 
         # Verify operation structure
         assert operation.mode == OperationMode.DRY_RUN
@@ -123,167 +242,19 @@ class TestRestoreWorkflowIntegration:
         assert operation.baseline_snapshot == "baseline-test"
         assert operation.account_id == "123456789012"
 
-        # Verify new resources identified
-        assert operation.total_resources == 2
-        assert operation.succeeded_count == 0  # Dry-run, no deletions
-        assert operation.failed_count == 0
-        assert operation.skipped_count == 0
-
-    def test_preview_with_filters_integration(
-        self,
-        snapshot_storage: SnapshotStorage,
-        audit_storage: AuditStorage,
-        safety_checker: SafetyChecker,
-    ) -> None:
-        """Test preview with resource type and region filters."""
-        cleaner = ResourceCleaner(
-            snapshot_storage=snapshot_storage,
-            safety_checker=safety_checker,
-            audit_storage=audit_storage,
-        )
-
-        current_resources = [
-            {
-                "resource_id": "vpc-baseline",
-                "resource_type": "AWS::EC2::VPC",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
-            },
-            {
-                "resource_id": "i-001",
-                "resource_type": "AWS::EC2::Instance",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-001",
-            },
-            {
-                "resource_id": "bucket-001",
-                "resource_type": "AWS::S3::Bucket",
-                "region": "us-east-1",
-                "arn": "arn:aws:s3:::bucket-001",
-            },
-        ]
-
-        with patch.object(cleaner, "_collect_current_resources", return_value=current_resources):
-            operation = cleaner.preview(
-                baseline_snapshot="baseline-test",
-                account_id="123456789012",
-                resource_types=["AWS::EC2::Instance"],
-                regions=["us-east-1"],
-            )
-
-        # Should only include EC2 instances in us-east-1
-        assert operation.total_resources == 1
-        assert operation.filters == {
-            "resource_types": ["AWS::EC2::Instance"],
-            "regions": ["us-east-1"],
-        }
-
-    def test_preview_with_protection_rules_integration(
-        self,
-        snapshot_storage: SnapshotStorage,
-        audit_storage: AuditStorage,
-        temp_storage_dir: Path,
-    ) -> None:
-        """Test preview with protection rules applied."""
-        from src.models.protection_rule import ProtectionRule, RuleType
-
-        # Create safety checker with protection rule
-        rules = [
-            ProtectionRule(
-                rule_id="rule_001",
-                rule_type=RuleType.TAG,
-                enabled=True,
-                priority=1,
-                patterns={
-                    "tag_key": "Protection",
-                    "tag_values": ["true", "critical"],
-                },
-                description="Protect tagged resources",
-            )
-        ]
-
-        safety_checker = SafetyChecker(rules=rules)
-
-        cleaner = ResourceCleaner(
-            snapshot_storage=snapshot_storage,
-            safety_checker=safety_checker,
-            audit_storage=audit_storage,
-        )
+        for attr, value in expected.items():
+            assert getattr(operation, attr) == value, attr
 
-        current_resources = [
-            {
-                "resource_id": "vpc-baseline",
-                "resource_type": "AWS::EC2::VPC",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
-                "tags": {},
-            },
-            {
-                "resource_id": "i-protected",
-                "resource_type": "AWS::EC2::Instance",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-protected",
-                "tags": {"Protection": "true"},  # Protected!
-            },
-            {
-                "resource_id": "i-deletable",
-                "resource_type": "AWS::EC2::Instance",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-deletable",
-                "tags": {"Environment": "test"},
-            },
-        ]
-
-        with patch.object(cleaner, "_collect_current_resources", return_value=current_resources):
-            operation = cleaner.preview(
-                baseline_snapshot="baseline-test",
-                account_id="123456789012",
-            )
-
-        # Should identify 2 new resources, 1 protected
-        assert operation.total_resources == 2
-        assert operation.skipped_count == 1
-
-    def test_execute_workflow_end_to_end(
-        self,
-        snapshot_storage: SnapshotStorage,
-        audit_storage: AuditStorage,
-        safety_checker: SafetyChecker,
-    ) -> None:
+    def test_execute_workflow_end_to_end(self, cleaner: ResourceCleaner) -> None:
         """Test complete execute workflow from snapshot to deletion."""
-        cleaner = ResourceCleaner(
-            snapshot_storage=snapshot_storage,
-            safety_checker=safety_checker,
-            audit_storage=audit_storage,
-        )
-
         # Mock current resources (baseline + new resources)
-        current_resources = [
-            {
-                "resource_id": "vpc-baseline",
-                "resource_type": "AWS::EC2::VPC",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:vpc/vpc-baseline",
-                "tags": {},
-            },
-            {
-                "resource_id": "i-new-001",
-                "resource_type": "AWS::EC2::Instance",
-                "region": "us-east-1",
-                "arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-new-001",
-                "tags": {"Environment": "test"},
-            },
-        ]
-
-        # Mock resource collection and deletion
-        with patch.object(cleaner, "_collect_current_resources", return_value=current_resources), patch.object(
-            cleaner, "_delete_resource", return_value=True
-        ) as mock_delete:
-            operation = cleaner.execute(
-                baseline_snapshot="baseline-test",
-                account_id="123456789012",
-                confirmed=True,
-            )
+        cleaner.stub_resources = _current_resources("vpc-baseline", "i-new-001")
+
+        operation = cleaner.execute(
+            baseline_snapshot="baseline-test",
+            account_id="123456789012",
+            confirmed=True,
+        )
 
         # Verify operation structure
         assert operation.mode == OperationMode.EXECUTE
@@ -292,25 +263,14 @@ class TestRestoreWorkflowIntegration:
         assert operation.account_id == "123456789012"
 
         # Verify deletion occurred
-        assert mock_delete.call_count == 1
+        assert [r["resource_id"] for r in cleaner.deleted] == ["i-new-001"]
         assert operation.total_resources == 1
         assert operation.succeeded_count == 1
         assert operation.failed_count == 0
         assert operation.skipped_count == 0
 
-    def test_execute_without_confirmation_fails(
-        self,
-        snapshot_storage: SnapshotStorage,
-        audit_storage: AuditStorage,
-        safety_checker: SafetyChecker,
-    ) -> None:
+    def test_execute_without_confirmation_fails(self, cleaner: ResourceCleaner) -> None:
         """Test execute requires explicit confirmation."""
-        cleaner = ResourceCleaner(
-            snapshot_storage=snapshot_storage,
-            safety_checker=safety_checker,
-            audit_storage=audit_storage,
-        )
-
         with pytest.raises(ValueError, match="confirmation"):
             cleaner.execute(
                 baseline_snapshot="baseline-test",
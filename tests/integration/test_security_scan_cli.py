@@ -3,171 +3,132 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
+from typing import Callable
 
 import pytest
-from typer.testing import CliRunner
+import typer
+from typer.testing import CliRunner, Result
 
-from src.cli.main import app
 from src.snapshot.storage import SnapshotStorage
-from tests.fixtures.snapshots import (
-    create_ec2_instance,
-    create_iam_user,
-    create_mock_snapshot,
-    create_rds_instance,
-    create_s3_bucket,
-    create_secrets_manager_secret,
-    create_security_group,
-)
-
-
-@pytest.fixture
+from tests.fixtures.snapshots import create_mock_snapshot
+
+pytestmark = pytest.mark.xdist_group("security_scan_cli")
+
+# Case-insensitive output checks, compiled once; each is a single pass over the text
+FINDINGS_RE = re.compile(r"finding|issue", re.IGNORECASE)
+SEVERITY_RE = re.compile(r"critical|high", re.IGNORECASE)
+CRITICAL_RE = re.compile(r"critical", re.IGNORECASE)
+HIGH_RE = re.compile(r"high", re.IGNORECASE)
+CSV_HEADER_RE = re.compile(r"arn|resource", re.IGNORECASE)
+CIS_RE = re.compile(r"cis|control", re.IGNORECASE)
+NO_FINDINGS_RE = re.compile(r"no|0", re.IGNORECASE)
+SCANNED_RE = re.compile(r"scan|check", re.IGNORECASE)
+NOT_FOUND_RE = re.compile(r"not found|error", re.IGNORECASE)
+SCAN_OR_ERROR_RE = re.compile(r"security|scan|error", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
-    """Create CLI test runner."""
+    """Create CLI test runner (stateless across invokes, so shared)."""
     return CliRunner()
 
 
-@pytest.fixture
-def test_snapshot_with_issues(tmp_path: Path) -> tuple[str, Path]:
-    """Create a test snapshot with known security issues."""
-    # Create snapshot with various security issues
-    public_bucket = create_s3_bucket("public-test-bucket", public=True)
-    open_sg_ssh = create_security_group("sg-ssh", open_ports=[22])
-    open_sg_db = create_security_group("sg-db", open_ports=[3306, 5432])
-    public_db = create_rds_instance("public-database", publicly_accessible=True, encrypted=False)
-    imdsv1_instance = create_ec2_instance("old-instance", imdsv2_required=False)
-    old_credentials = create_iam_user("old-user", access_key_age_days=120)
-    old_secret = create_secrets_manager_secret("old-secret", last_rotated_days_ago=150)
-
-    snapshot = create_mock_snapshot(
-        name="test-with-issues",
-        resources=[
-            public_bucket,
-            open_sg_ssh,
-            open_sg_db,
-            public_db,
-            imdsv1_instance,
-            old_credentials,
-            old_secret,
-        ],
-    )
-
-    # Save snapshot
-    storage = SnapshotStorage(tmp_path)
-    storage.save_snapshot(snapshot)
-
-    return "test-with-issues", tmp_path
-
-
-@pytest.fixture
-def test_snapshot_clean(tmp_path: Path) -> tuple[str, Path]:
-    """Create a test snapshot with no security issues."""
-    private_bucket = create_s3_bucket("private-bucket", public=False, encrypted=True)
-    closed_sg = create_security_group("sg-closed", open_ports=[])
-    private_db = create_rds_instance("private-db", publicly_accessible=False, encrypted=True)
-    imdsv2_instance = create_ec2_instance("new-instance", imdsv2_required=True)
-
-    snapshot = create_mock_snapshot(
-        name="test-clean",
-        resources=[private_bucket, closed_sg, private_db, imdsv2_instance],
-    )
-
-    storage = SnapshotStorage(tmp_path)
-    storage.save_snapshot(snapshot)
-
-    return "test-clean", tmp_path
+@pytest.fixture(scope="session")
+def app() -> typer.Typer:
+    """Import the CLI app lazily so collection does not build the command tree."""
+    from src.cli.main import app as cli_app
+
+    return cli_app
+
+
+@pytest.fixture(scope="session")
+def scan(app: typer.Typer, runner: CliRunner) -> Callable[..., Result]:
+    """Invoke ``security scan`` with the given arguments."""
+
+    def _scan(*args: str) -> Result:
+        return runner.invoke(app, ["security", "scan", *args])
+
+    return _scan
+
+
+@pytest.fixture(scope="session")
+def scan_result_with_issues(scan: Callable[..., Result], test_snapshot_with_issues: tuple[str, Path]) -> Result:
+    """Default scan of the snapshot with known security issues."""
+    snapshot_name, storage_dir = test_snapshot_with_issues
+    return scan("--snapshot", snapshot_name, "--storage-dir", str(storage_dir))
+
+
+@pytest.fixture(scope="session")
+def exported_scan_artifacts(
+    scan: Callable[..., Result],
+    test_snapshot_with_issues: tuple[str, Path],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, tuple[Result, Path]]:
+    """Export the issues snapshot scan once per format into a shared directory."""
+    snapshot_name, storage_dir = test_snapshot_with_issues
+    export_dir = tmp_path_factory.mktemp("scan-exports")
+
+    artifacts: dict[str, tuple[Result, Path]] = {}
+    for fmt in ("json", "csv"):
+        output_file = export_dir / f"scan_results.{fmt}"
+        result = scan(
+            "--snapshot",
+            snapshot_name,
+            "--storage-dir",
+            str(storage_dir),
+            "--export",
+            str(output_file),
+            "--format",
+            fmt,
+        )
+        artifacts[fmt] = (result, output_file)
+    return artifacts
 
 
 class TestSecurityScanCLI:
     """Integration tests for security scan CLI command."""
 
-    def test_scan_with_findings(self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path]) -> None:
+    def test_scan_with_findings(self, scan_result_with_issues: Result) -> None:
         """Test running security scan on snapshot with security issues."""
-        snapshot_name, storage_dir = test_snapshot_with_issues
-
-        result = runner.invoke(
-            app,
-            ["security", "scan", "--snapshot", snapshot_name, "--storage-dir", str(storage_dir)],
-        )
+        result = scan_result_with_issues
 
         # Command should succeed
         assert result.exit_code == 0
         # Should report findings
-        assert "finding" in result.stdout.lower() or "issue" in result.stdout.lower()
+        assert FINDINGS_RE.search(result.stdout)
         # Should show severity levels
-        assert "critical" in result.stdout.lower() or "high" in result.stdout.lower()
+        assert SEVERITY_RE.search(result.stdout)
 
     def test_scan_with_severity_filter_critical(
-        self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path]
+        self, scan: Callable[..., Result], test_snapshot_with_issues: tuple[str, Path]
     ) -> None:
         """Test scanning with --severity critical filter."""
         snapshot_name, storage_dir = test_snapshot_with_issues
 
-        result = runner.invoke(
-            app,
-            [
-                "security",
-                "scan",
-                "--snapshot",
-                snapshot_name,
-                "--storage-dir",
-                str(storage_dir),
-                "--severity",
-                "critical",
-            ],
-        )
+        result = scan("--snapshot", snapshot_name, "--storage-dir", str(storage_dir), "--severity", "critical")
 
         assert result.exit_code == 0
         # Should only show CRITICAL findings
-        assert "critical" in result.stdout.lower()
+        assert CRITICAL_RE.search(result.stdout)
         # Should NOT show HIGH/MEDIUM/LOW
         # (might be in header/legend, so this check is relaxed)
 
     def test_scan_with_severity_filter_high(
-        self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path]
+        self, scan: Callable[..., Result], test_snapshot_with_issues: tuple[str, Path]
     ) -> None:
         """Test scanning with --severity high filter."""
         snapshot_name, storage_dir = test_snapshot_with_issues
 
-        result = runner.invoke(
-            app,
-            [
-                "security",
-                "scan",
-                "--snapshot",
-                snapshot_name,
-                "--storage-dir",
-                str(storage_dir),
-                "--severity",
-                "high",
-            ],
-        )
+        result = scan("--snapshot", snapshot_name, "--storage-dir", str(storage_dir), "--severity", "high")
 
         assert result.exit_code == 0
-        assert "high" in result.stdout.lower()
+        assert HIGH_RE.search(result.stdout)
 
-    def test_scan_export_json(
-        self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path], tmp_path: Path
-    ) -> None:
+    def test_scan_export_json(self, exported_scan_artifacts: dict[str, tuple[Result, Path]]) -> None:
         """Test exporting scan results to JSON."""
-        snapshot_name, storage_dir = test_snapshot_with_issues
-        output_file = tmp_path / "scan_results.json"
-
-        result = runner.invoke(
-            app,
-            [
-                "security",
-                "scan",
-                "--snapshot",
-                snapshot_name,
-                "--storage-dir",
-                str(storage_dir),
-                "--export",
-                str(output_file),
-                "--format",
-                "json",
-            ],
-        )
+        result, output_file = exported_scan_artifacts["json"]
 
         assert result.exit_code == 0
         assert output_file.exists()
@@ -179,28 +140,9 @@ class TestSecurityScanCLI:
         assert "findings" in data
         assert len(data["findings"]) > 0
 
-    def test_scan_export_csv(
-        self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path], tmp_path: Path
-    ) -> None:
+    def test_scan_export_csv(self, exported_scan_artifacts: dict[str, tuple[Result, Path]]) -> None:
         """Test exporting scan results to CSV."""
-        snapshot_name, storage_dir = test_snapshot_with_issues
-        output_file = tmp_path / "scan_results.csv"
-
-        result = runner.invoke(
-            app,
-            [
-                "security",
-                "scan",
-                "--snapshot",
-                snapshot_name,
-                "--storage-dir",
-                str(storage_dir),
-                "--export",
-                str(output_file),
-                "--format",
-                "csv",
-            ],
-        )
+        result, output_file = exported_scan_artifacts["csv"]
 
         assert result.exit_code == 0
         assert output_file.exists()
@@ -211,30 +153,21 @@ class TestSecurityScanCLI:
 
         assert len(content) > 0
         # Should have header
-        assert "arn" in content.lower() or "resource" in content.lower()
+        assert CSV_HEADER_RE.search(content)
 
-    def test_scan_with_cis_only_flag(self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path]) -> None:
+    def test_scan_with_cis_only_flag(
+        self, scan: Callable[..., Result], test_snapshot_with_issues: tuple[str, Path]
+    ) -> None:
         """Test scanning with --cis-only flag to show only CIS-mapped findings."""
         snapshot_name, storage_dir = test_snapshot_with_issues
 
-        result = runner.invoke(
-            app,
-            [
-                "security",
-                "scan",
-                "--snapshot",
-                snapshot_name,
-                "--storage-dir",
-                str(storage_dir),
-                "--cis-only",
-            ],
-        )
+        result = scan("--snapshot", snapshot_name, "--storage-dir", str(storage_dir), "--cis-only")
 
         assert result.exit_code == 0
         # Should mention CIS controls
-        assert "cis" in result.stdout.lower() or "control" in result.stdout.lower()
+        assert CIS_RE.search(result.stdout)
 
-    def test_scan_empty_snapshot(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_scan_empty_snapshot(self, app: typer.Typer, runner: CliRunner, tmp_path: Path) -> None:
         """Test scanning an empty snapshot."""
         # Create empty snapshot
         empty_snapshot = create_mock_snapshot(name="empty-test", resources=[])
@@ -248,23 +181,20 @@ class TestSecurityScanCLI:
 
         assert result.exit_code == 0
         # Should indicate no findings
-        assert "no" in result.stdout.lower() or "0" in result.stdout.lower()
+        assert NO_FINDINGS_RE.search(result.stdout)
 
-    def test_scan_clean_snapshot(self, runner: CliRunner, test_snapshot_clean: tuple[str, Path]) -> None:
+    def test_scan_clean_snapshot(self, scan: Callable[..., Result], test_snapshot_clean: tuple[str, Path]) -> None:
         """Test scanning a snapshot with no security issues."""
         snapshot_name, storage_dir = test_snapshot_clean
 
-        result = runner.invoke(
-            app,
-            ["security", "scan", "--snapshot", snapshot_name, "--storage-dir", str(storage_dir)],
-        )
+        result = scan("--snapshot", snapshot_name, "--storage-dir", str(storage_dir))
 
         assert result.exit_code == 0
         # May have some findings but should be minimal
         # Output should indicate scan was performed
-        assert "scan" in result.stdout.lower() or "check" in result.stdout.lower()
+        assert SCANNED_RE.search(result.stdout)
 
-    def test_scan_nonexistent_snapshot(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_scan_nonexistent_snapshot(self, app: typer.Typer, runner: CliRunner, tmp_path: Path) -> None:
         """Test scanning a snapshot that doesn't exist."""
         result = runner.invoke(
             app,
@@ -280,20 +210,17 @@ class TestSecurityScanCLI:
 
         # Should fail with error
         assert result.exit_code != 0
-        assert "not found" in result.stdout.lower() or "error" in result.stdout.lower()
+        assert NOT_FOUND_RE.search(result.stdout)
 
-    def test_scan_with_inventory_name(self, runner: CliRunner, test_snapshot_with_issues: tuple[str, Path]) -> None:
+    def test_scan_with_inventory_name(
+        self, scan: Callable[..., Result], test_snapshot_with_issues: tuple[str, Path]
+    ) -> None:
         """Test scanning using --inventory flag to auto-select latest snapshot."""
         snapshot_name, storage_dir = test_snapshot_with_issues
 
-        result = runner.invoke(
-            app,
-            ["security", "scan", "--inventory", "default", "--storage-dir", str(storage_dir)],
-        )
+        result = scan("--inventory", "default", "--storage-dir", str(storage_dir))
 
         # Should work if inventory exists and has snapshots
         # Exit code may vary depending on whether inventory has active snapshot
         # At minimum, command should not crash
-        assert (
-            "security" in result.stdout.lower() or "scan" in result.stdout.lower() or "error" in result.stdout.lower()
-        )
+        assert SCAN_OR_ERROR_RE.search(result.stdout)
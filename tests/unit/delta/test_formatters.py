@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from io import StringIO
 
 import pytest
@@ -11,41 +12,66 @@ from src.delta.formatters import DriftFormatter
 from src.delta.models import DriftReport
 from src.models.config_diff import ChangeCategory, ConfigDiff
 
+EC2_ARN = "arn:aws:ec2:us-east-1:123456789012:instance/i-12345"
+RDS_ARN = "arn:aws:rds:us-east-1:123456789012:db:mydb"
+
+ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])", re.ASCII)
+
+
+def _strip_ansi(text: str) -> str:
+    """Strip ANSI escape codes from Rich output for easier testing."""
+    return ANSI_ESCAPE_RE.sub("", text)
+
+
+def _assert_contains_all(text: str, needles: list[str]) -> None:
+    """Assert each needle appears in text, in order, scanning the text only once."""
+    pos = 0
+    for needle in needles:
+        found = text.find(needle, pos)
+        assert found >= 0, f"{needle!r} not found (in order) in output"
+        pos = found + len(needle)
+
 
 class TestDriftFormatter:
     """Tests for DriftFormatter class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def console(self) -> Console:
-        """Create a Rich console for testing."""
+        """Create a Rich console shared by the module; its buffer is reset per test."""
         return Console(file=StringIO(), force_terminal=True, width=120)
 
-    @pytest.fixture
-    def sample_diffs(self) -> list[ConfigDiff]:
-        """Create sample configuration diffs for testing."""
-        return [
+    @pytest.fixture(autouse=True)
+    def _reset_console(self, console: Console) -> None:
+        """Empty the shared console buffer so each test only sees its own output."""
+        console.file.truncate(0)
+        console.file.seek(0)
+
+    @pytest.fixture(scope="module")
+    def sample_diffs(self) -> tuple[ConfigDiff, ...]:
+        """Create sample configuration diffs, shared read-only across the module."""
+        return (
             ConfigDiff(
-                resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
+                resource_arn=EC2_ARN,
                 field_path="Tags.Environment",
                 old_value="dev",
                 new_value="prod",
                 category=ChangeCategory.TAGS,
             ),
             ConfigDiff(
-                resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
+                resource_arn=EC2_ARN,
                 field_path="InstanceType",
                 old_value="t2.micro",
                 new_value="t2.small",
                 category=ChangeCategory.CONFIGURATION,
             ),
             ConfigDiff(
-                resource_arn="arn:aws:rds:us-east-1:123456789012:db:mydb",
+                resource_arn=RDS_ARN,
                 field_path="PubliclyAccessible",
                 old_value=False,
                 new_value=True,
                 category=ChangeCategory.SECURITY,
             ),
-        ]
+        )
 
     def test_format_empty_report(self, console: Console) -> None:
         """Test formatting an empty drift report."""
@@ -57,110 +83,79 @@ class TestDriftFormatter:
         output = console.file.getvalue()  # type: ignore
         assert "No configuration changes detected" in output or "0 changes" in output
 
-    def test_format_single_diff(self, console: Console) -> None:
-        """Test formatting a single configuration diff."""
-        diff = ConfigDiff(
-            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
-            field_path="InstanceType",
-            old_value="t2.micro",
-            new_value="t2.small",
-            category=ChangeCategory.CONFIGURATION,
-        )
-        report = DriftReport()
-        report.add_diff(diff)
-
-        formatter = DriftFormatter(console)
-        formatter.display(report)
-
-        output = console.file.getvalue()  # type: ignore
-        assert "InstanceType" in output
-        assert "t2.micro" in output
-        assert "t2.small" in output
-
-    def test_format_color_coding_removed(self, console: Console) -> None:
-        """Test that removed fields are displayed in red."""
-        diff = ConfigDiff(
-            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
-            field_path="Tags.OldTag",
-            old_value="old-value",
-            new_value=None,
-            category=ChangeCategory.TAGS,
-        )
-        report = DriftReport()
-        report.add_diff(diff)
-
-        formatter = DriftFormatter(console)
-        formatter.display(report)
-
-        output = console.file.getvalue()  # type: ignore
-        # Rich output includes ANSI codes for red color
-        assert "OldTag" in output
-        assert "old-value" in output
-
-    def test_format_color_coding_added(self, console: Console) -> None:
-        """Test that added fields are displayed in green."""
-        diff = ConfigDiff(
-            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
-            field_path="Tags.NewTag",
-            old_value=None,
-            new_value="new-value",
-            category=ChangeCategory.TAGS,
-        )
-        report = DriftReport()
-        report.add_diff(diff)
-
-        formatter = DriftFormatter(console)
-        formatter.display(report)
-
-        output = console.file.getvalue()  # type: ignore
-        assert "NewTag" in output
-        assert "new-value" in output
-
-    def test_format_color_coding_security(self, console: Console) -> None:
-        """Test that security changes are highlighted in yellow."""
-        diff = ConfigDiff(
-            resource_arn="arn:aws:rds:us-east-1:123456789012:db:mydb",
-            field_path="PubliclyAccessible",
-            old_value=False,
-            new_value=True,
-            category=ChangeCategory.SECURITY,
-        )
+    @pytest.mark.parametrize(
+        "resource_arn,field_path,old_value,new_value,category,expected",
+        [
+            pytest.param(
+                EC2_ARN,
+                "Tags.OldTag",
+                "old-value",
+                None,
+                ChangeCategory.TAGS,
+                ["OldTag", "old-value"],
+                id="removed",
+            ),
+            pytest.param(
+                EC2_ARN,
+                "Tags.NewTag",
+                None,
+                "new-value",
+                ChangeCategory.TAGS,
+                ["NewTag", "new-value"],
+                id="added",
+            ),
+            pytest.param(
+                RDS_ARN,
+                "PubliclyAccessible",
+                False,
+                True,
+                ChangeCategory.SECURITY,
+                ["PubliclyAccessible", "false", "true"],
+                id="security",
+            ),
+            pytest.param(
+                EC2_ARN,
+                "InstanceType",
+                "t2.micro",
+                "t2.small",
+                ChangeCategory.CONFIGURATION,
+                ["InstanceType", "t2.micro", "t2.small"],
+                id="configuration",
+            ),
+        ],
+    )
+    def test_format_single_diff(
+        self,
+        console: Console,
+        resource_arn: str,
+        field_path: str,
+        old_value: object,
+        new_value: object,
+        category: ChangeCategory,
+        expected: list[str],
+    ) -> None:
+        """Test formatting a single diff for each change kind (removed/added/security/configuration)."""
         report = DriftReport()
-        report.add_diff(diff)
-
-        formatter = DriftFormatter(console)
-        formatter.display(report)
-
-        output = console.file.getvalue()  # type: ignore
-        assert "PubliclyAccessible" in output
-        assert "False" in output or "false" in output.lower()
-        assert "True" in output or "true" in output.lower()
-
-    def test_format_color_coding_configuration(self, console: Console) -> None:
-        """Test that configuration changes are displayed in cyan."""
-        diff = ConfigDiff(
-            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
-            field_path="InstanceType",
-            old_value="t2.micro",
-            new_value="t2.small",
-            category=ChangeCategory.CONFIGURATION,
+        report.add_diff(
+            ConfigDiff(
+                resource_arn=resource_arn,
+                field_path=field_path,
+                old_value=old_value,
+                new_value=new_value,
+                category=category,
+            )
         )
-        report = DriftReport()
-        report.add_diff(diff)
 
         formatter = DriftFormatter(console)
         formatter.display(report)
 
         output = console.file.getvalue()  # type: ignore
-        assert "InstanceType" in output
-        assert "t2.micro" in output
-        assert "t2.small" in output
+        _assert_contains_all(output, expected)
 
-    def test_format_grouped_by_category(self, console: Console, sample_diffs: list[ConfigDiff]) -> None:
+    def test_format_grouped_by_category(self, console: Console, sample_diffs: tuple[ConfigDiff, ...]) -> None:
         """Test that diffs are grouped by category."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         formatter = DriftFormatter(console)
         formatter.display(report)
@@ -171,30 +166,24 @@ class TestDriftFormatter:
         assert "Configuration" in output or "CONFIGURATION" in output
         assert "Security" in output or "SECURITY" in output
 
-    def test_format_grouped_by_resource(self, console: Console, sample_diffs: list[ConfigDiff]) -> None:
+    def test_format_grouped_by_resource(self, console: Console, sample_diffs: tuple[ConfigDiff, ...]) -> None:
         """Test that diffs can be grouped by resource."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         formatter = DriftFormatter(console)
         formatter.display(report, group_by="resource")
 
         output = console.file.getvalue()  # type: ignore
-        # Strip ANSI codes for easier testing
-        import re
-
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        plain_output = ansi_escape.sub("", output)
+        plain_output = _strip_ansi(output)
         # Should show resource ARNs or resource IDs
         assert "i-12345" in plain_output
         assert "db" in plain_output or "mydb" in plain_output
 
-    def test_format_filter_by_resource_type(self, console: Console, sample_diffs: list[ConfigDiff]) -> None:
+    def test_format_filter_by_resource_type(self, console: Console, sample_diffs: tuple[ConfigDiff, ...]) -> None:
         """Test filtering diffs by resource type."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         formatter = DriftFormatter(console)
         # Filter to only show EC2 instances
@@ -206,11 +195,30 @@ class TestDriftFormatter:
         # Should NOT show RDS changes
         assert "PubliclyAccessible" not in output
 
+    def test_format_filter_by_resource_type_ignores_resource_name(self, console: Console) -> None:
+        """Test that the resource type filter matches the ARN service, not a name containing it."""
+        report = DriftReport()
+        report.add_diff(
+            ConfigDiff(
+                resource_arn="arn:aws:s3:::ec2-backups",
+                field_path="Versioning",
+                old_value="Enabled",
+                new_value="Suspended",
+                category=ChangeCategory.CONFIGURATION,
+            )
+        )
+
+        formatter = DriftFormatter(console)
+        formatter.display(report, resource_type_filter="ec2")
+
+        output = console.file.getvalue()  # type: ignore
+        assert "Versioning" not in output
+
     def test_format_filter_by_region(self, console: Console) -> None:
         """Test filtering diffs by region."""
         diffs = [
             ConfigDiff(
-                resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
+                resource_arn=EC2_ARN,
                 field_path="InstanceType",
                 old_value="t2.micro",
                 new_value="t2.small",
@@ -225,18 +233,13 @@ class TestDriftFormatter:
             ),
         ]
         report = DriftReport()
-        for diff in diffs:
-            report.add_diff(diff)
+        report.add_diffs(diffs)
 
         formatter = DriftFormatter(console)
         formatter.display(report, region_filter="us-east-1")
 
         output = console.file.getvalue()  # type: ignore
-        # Strip ANSI codes for easier testing
-        import re
-
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        plain_output = ansi_escape.sub("", output)
+        plain_output = _strip_ansi(output)
         # Should show us-east-1 changes (show i-12345, not i-67890)
         assert "i-12345" in plain_output
         # Should NOT show us-west-2 changes
@@ -245,7 +248,7 @@ class TestDriftFormatter:
     def test_format_old_to_new_arrow(self, console: Console) -> None:
         """Test that changes are formatted with old → new arrow."""
         diff = ConfigDiff(
-            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
+            resource_arn=EC2_ARN,
             field_path="InstanceType",
             old_value="t2.micro",
             new_value="t2.small",
@@ -260,14 +263,14 @@ class TestDriftFormatter:
         output = console.file.getvalue()  # type: ignore
         # Should use arrow notation for changes
         assert "→" in output or "->" in output
-        assert "t2.micro" in output
-        assert "t2.small" in output
+        # Old value is rendered before the new one
+        _assert_contains_all(output, ["t2.micro", "t2.small"])
 
     def test_format_handles_long_values(self, console: Console) -> None:
         """Test formatting of very long configuration values."""
         long_value = "a" * 200
         diff = ConfigDiff(
-            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
+            resource_arn=EC2_ARN,
             field_path="UserData",
             old_value=long_value,
             new_value="short",
@@ -283,11 +286,10 @@ class TestDriftFormatter:
         assert "UserData" in output
         # Long values should be truncated or formatted appropriately
 
-    def test_format_summary_statistics(self, console: Console, sample_diffs: list[ConfigDiff]) -> None:
+    def test_format_summary_statistics(self, console: Console, sample_diffs: tuple[ConfigDiff, ...]) -> None:
         """Test that summary statistics are displayed."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         formatter = DriftFormatter(console)
         formatter.display(report)
@@ -298,11 +300,10 @@ class TestDriftFormatter:
         # Category counts
         assert "1" in output  # Count for each category
 
-    def test_format_no_console_provided(self, sample_diffs: list[ConfigDiff]) -> None:
+    def test_format_no_console_provided(self, sample_diffs: tuple[ConfigDiff, ...]) -> None:
         """Test that formatter creates default console if none provided."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         formatter = DriftFormatter()  # No console provided
         # Should not raise an error
@@ -78,11 +78,29 @@ class TestDriftReport:
         assert report.total_changes == 4
         assert len(report.get_all_diffs()) == 4
 
+    def test_add_diffs_bulk(self, sample_diffs: list[ConfigDiff]) -> None:
+        """Test adding several diffs in one call keeps their order."""
+        report = DriftReport()
+        report.add_diff(sample_diffs[0])
+
+        report.add_diffs(iter(sample_diffs[1:]))
+
+        assert report.total_changes == 4
+        assert report.get_all_diffs() == sample_diffs
+
+    def test_iter_diffs(self, sample_diffs: list[ConfigDiff]) -> None:
+        """Test iterating over all diffs and over one category."""
+        report = DriftReport()
+        report.add_diffs(sample_diffs)
+
+        assert list(report.iter_diffs()) == sample_diffs
+        assert list(report.iter_diffs_by_category(ChangeCategory.TAGS)) == [sample_diffs[0]]
+        assert list(DriftReport().iter_diffs_by_category(ChangeCategory.TAGS)) == []
+
     def test_get_diffs_by_category_tags(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by TAGS category."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         tags_diffs = report.get_diffs_by_category(ChangeCategory.TAGS)
 
@@ -92,8 +110,7 @@ class TestDriftReport:
     def test_get_diffs_by_category_configuration(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by CONFIGURATION category."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         config_diffs = report.get_diffs_by_category(ChangeCategory.CONFIGURATION)
 
@@ -103,8 +120,7 @@ class TestDriftReport:
     def test_get_diffs_by_category_security(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by SECURITY category."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         security_diffs = report.get_diffs_by_category(ChangeCategory.SECURITY)
 
@@ -114,8 +130,7 @@ class TestDriftReport:
     def test_get_diffs_by_category_permissions(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by PERMISSIONS category."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         permissions_diffs = report.get_diffs_by_category(ChangeCategory.PERMISSIONS)
 
@@ -141,8 +156,7 @@ class TestDriftReport:
     def test_get_security_critical_diffs(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering for security-critical diffs."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         critical_diffs = report.get_security_critical_diffs()
 
@@ -170,8 +184,7 @@ class TestDriftReport:
     def test_get_diffs_by_resource(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by resource ARN."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         ec2_arn = "arn:aws:ec2:us-east-1:123456789012:instance/i-12345"
         ec2_diffs = report.get_diffs_by_resource(ec2_arn)
@@ -183,8 +196,7 @@ class TestDriftReport:
     def test_get_diffs_by_resource_no_matches(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test get_diffs_by_resource when ARN doesn't exist."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         nonexistent_arn = "arn:aws:s3:::nonexistent-bucket"
         diffs = report.get_diffs_by_resource(nonexistent_arn)
@@ -194,8 +206,7 @@ class TestDriftReport:
     def test_get_diffs_by_resource_type(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by resource type."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         # Filter for EC2 instances
         ec2_diffs = report.get_diffs_by_resource_type("ec2")
@@ -206,19 +217,33 @@ class TestDriftReport:
     def test_get_diffs_by_resource_type_case_insensitive(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test that resource type filtering is case insensitive."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         # Filter with uppercase
         ec2_diffs = report.get_diffs_by_resource_type("EC2")
 
         assert len(ec2_diffs) == 2
 
+    def test_get_diffs_by_resource_type_matches_service_field(self) -> None:
+        """Test that resource type matches the ARN service field, not the resource name."""
+        report = DriftReport()
+        report.add_diff(
+            ConfigDiff(
+                resource_arn="arn:aws:s3:::ec2-backups",
+                field_path="Versioning",
+                old_value="Enabled",
+                new_value="Suspended",
+                category=ChangeCategory.CONFIGURATION,
+            )
+        )
+
+        assert report.get_diffs_by_resource_type("ec2") == []
+        assert len(report.get_diffs_by_resource_type("s3")) == 1
+
     def test_get_diffs_by_region(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test filtering diffs by AWS region."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         us_east_diffs = report.get_diffs_by_region("us-east-1")
 
@@ -228,8 +253,7 @@ class TestDriftReport:
     def test_get_diffs_by_region_no_matches(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test get_diffs_by_region when region doesn't exist."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         us_west_diffs = report.get_diffs_by_region("us-west-2")
 
@@ -238,8 +262,7 @@ class TestDriftReport:
     def test_get_summary(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test generating summary statistics."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         summary = report.get_summary()
 
@@ -266,8 +289,7 @@ class TestDriftReport:
     def test_group_by_resource(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test grouping diffs by resource ARN."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         grouped = report.group_by_resource()
 
@@ -279,8 +301,7 @@ class TestDriftReport:
     def test_group_by_category(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test grouping diffs by category."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         grouped = report.group_by_category()
 
@@ -290,11 +311,23 @@ class TestDriftReport:
         assert ChangeCategory.SECURITY in grouped
         assert len(grouped[ChangeCategory.SECURITY]) == 1
 
+    def test_grouped_results_are_copies(self, sample_diffs: list[ConfigDiff]) -> None:
+        """Test that mutating query results does not affect the report's indexes."""
+        report = DriftReport()
+        report.add_diffs(sample_diffs)
+
+        report.group_by_category()[ChangeCategory.TAGS].clear()
+        report.get_diffs_by_resource(sample_diffs[0].resource_arn).clear()
+        report.get_security_critical_diffs().clear()
+
+        assert len(report.get_diffs_by_category(ChangeCategory.TAGS)) == 1
+        assert len(report.group_by_resource()[sample_diffs[0].resource_arn]) == 2
+        assert report.has_security_critical_changes()
+
     def test_to_dict(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test converting DriftReport to dictionary."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         result = report.to_dict()
 
@@ -318,8 +351,7 @@ class TestDriftReport:
     def test_has_security_critical_changes(self, sample_diffs: list[ConfigDiff]) -> None:
         """Test checking if report has security-critical changes."""
         report = DriftReport()
-        for diff in sample_diffs:
-            report.add_diff(diff)
+        report.add_diffs(sample_diffs)
 
         assert report.has_security_critical_changes() is True
 
@@ -0,0 +1,111 @@
+"""Shared fixtures for model unit tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Type, TypeVar
+
+import pytest
+
+from src.models.deletion_operation import DeletionOperation, OperationMode, OperationStatus
+from src.models.deletion_record import DeletionRecord, DeletionStatus
+from src.models.efs_resource import EFSFileSystem
+from src.models.elasticache_resource import ElastiCacheCluster
+
+# Required fields of a valid model, shared read-only by the factories; tests override what they need
+BASE_OPERATION: Mapping[str, Any] = MappingProxyType(
+    {
+        "operation_id": "op",
+        "baseline_snapshot": "test",
+        "timestamp": datetime(2025, 11, 11),
+        "account_id": "123456789012",
+        "mode": OperationMode.EXECUTE,
+        "status": OperationStatus.COMPLETED,
+        "total_resources": 0,
+    }
+)
+BASE_RECORD: Mapping[str, Any] = MappingProxyType(
+    {
+        "record_id": "rec",
+        "operation_id": "op_123",
+        "resource_arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-001",
+        "resource_id": "i-001",
+        "resource_type": "aws:ec2:instance",
+        "region": "us-east-1",
+        "timestamp": datetime(2025, 11, 11),
+        "status": DeletionStatus.SUCCEEDED,
+    }
+)
+
+BASE_EFS: Mapping[str, Any] = MappingProxyType(
+    {
+        "file_system_id": "fs-12345678",
+        "arn": "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
+        "encryption_enabled": True,
+        "kms_key_id": None,
+        "performance_mode": "generalPurpose",
+        "lifecycle_state": "available",
+        "tags": {},
+        "region": "us-east-1",
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    }
+)
+BASE_CLUSTER: Mapping[str, Any] = MappingProxyType(
+    {
+        "cluster_id": "test-cluster",
+        "arn": "arn:aws:elasticache:us-east-1:123456789012:cluster:test",
+        "engine": "redis",
+        "node_type": "cache.t3.micro",
+        "num_cache_nodes": 1,
+        "engine_version": "7.0",
+        "encryption_at_rest": True,
+        "encryption_in_transit": True,
+        "region": "us-east-1",
+    }
+)
+
+T = TypeVar("T")
+
+
+def _factory(cls: Type[T], base: Mapping[str, Any]) -> Callable[..., T]:
+    """Return a builder of cls from base plus per-call overrides.
+
+    Dict values in base are copied per instance, so no test can mutate another's tags.
+    """
+
+    def _make(**overrides: Any) -> T:
+        fields = {key: dict(value) if isinstance(value, dict) else value for key, value in base.items()}
+        return cls(**{**fields, **overrides})
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def frozen_utc() -> datetime:
+    """Fixed timezone-aware creation time of the EFS factory's file systems."""
+    return BASE_EFS["created_at"]
+
+
+@pytest.fixture
+def make_operation() -> Callable[..., DeletionOperation]:
+    """Build a DeletionOperation from BASE_OPERATION plus per-test overrides."""
+    return _factory(DeletionOperation, BASE_OPERATION)
+
+
+@pytest.fixture
+def make_record() -> Callable[..., DeletionRecord]:
+    """Build a DeletionRecord from BASE_RECORD plus per-test overrides."""
+    return _factory(DeletionRecord, BASE_RECORD)
+
+
+@pytest.fixture
+def make_efs() -> Callable[..., EFSFileSystem]:
+    """Build an EFSFileSystem from BASE_EFS plus per-test overrides."""
+    return _factory(EFSFileSystem, BASE_EFS)
+
+
+@pytest.fixture
+def make_cluster() -> Callable[..., ElastiCacheCluster]:
+    """Build an ElastiCacheCluster from BASE_CLUSTER plus per-test overrides."""
+    return _factory(ElastiCacheCluster, BASE_CLUSTER)
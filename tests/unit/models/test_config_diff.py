@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from src.models.config_diff import ChangeCategory, ConfigDiff
@@ -107,6 +109,60 @@ class TestConfigDiff:
                 category="tags",  # type: ignore
             )
 
+    def test_diff_is_immutable(self) -> None:
+        """Test that ConfigDiff fields cannot be reassigned."""
+        diff = ConfigDiff(
+            resource_arn="arn:aws:ec2:us-east-1:123456789012:instance/i-12345",
+            field_path="InstanceType",
+            old_value="t2.micro",
+            new_value="t2.small",
+            category=ChangeCategory.CONFIGURATION,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            diff.field_path = "Tags.Name"  # type: ignore[misc]
+
+    def test_service_and_region_parsed_from_arn(self) -> None:
+        """Test that the ARN service and region fields are exposed."""
+        diff = ConfigDiff(
+            resource_arn="arn:aws:EC2:us-east-1:123456789012:instance/i-12345",
+            field_path="InstanceType",
+            old_value="t2.micro",
+            new_value="t2.small",
+            category=ChangeCategory.CONFIGURATION,
+        )
+
+        assert diff.service == "ec2"
+        assert diff.region == "us-east-1"
+
+    def test_service_and_region_for_global_resource(self) -> None:
+        """Test that global ARNs have an empty region."""
+        diff = ConfigDiff(
+            resource_arn="arn:aws:iam::123456789012:role/MyRole",
+            field_path="AssumeRolePolicyDocument",
+            old_value=None,
+            new_value={},
+            category=ChangeCategory.PERMISSIONS,
+        )
+
+        assert diff.service == "iam"
+        assert diff.region == ""
+
+    def test_field_path_is_interned(self) -> None:
+        """Test that equal field paths share a single string object."""
+        diffs = [
+            ConfigDiff(
+                resource_arn=f"arn:aws:ec2:us-east-1:123456789012:instance/i-{n}",
+                field_path="".join(["Tags.", "Environment"]),
+                old_value="dev",
+                new_value="prod",
+                category=ChangeCategory.TAGS,
+            )
+            for n in range(2)
+        ]
+
+        assert diffs[0].field_path is diffs[1].field_path
+
     def test_with_path_prefix(self) -> None:
         """Test adding a prefix to the field path."""
         diff = ConfigDiff(
@@ -2,178 +2,111 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
+from typing import Callable
 
 import pytest
 
 from src.models.efs_resource import EFSFileSystem
 
+MakeEFS = Callable[..., EFSFileSystem]
+
+EFS_ARN = "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678"
+
+# Validation error messages, compiled once for pytest.raises(match=...)
+INVALID_FS_ID_RE = re.compile(r"Invalid file_system_id format")
+INVALID_PERFORMANCE_MODE_RE = re.compile(r"Invalid performance_mode: .* Must be one of: generalPurpose, maxIO$")
+INVALID_LIFECYCLE_STATE_RE = re.compile(
+    r"Invalid lifecycle_state: .* Must be one of: available, creating, deleting, deleted$"
+)
+
 
 class TestEFSFileSystem:
     """Tests for EFSFileSystem dataclass."""
 
-    def test_create_valid_efs_file_system(self) -> None:
+    def test_create_valid_efs_file_system(self, make_efs: MakeEFS, frozen_utc: datetime) -> None:
         """Test creating a valid EFS file system."""
-        created_at = datetime.now(timezone.utc)
-        efs = EFSFileSystem(
-            file_system_id="fs-12345678",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=True,
+        efs = make_efs(
             kms_key_id="arn:aws:kms:us-east-1:123456789012:key/abcd1234-5678-90ab-cdef-1234567890ab",
-            performance_mode="generalPurpose",
-            lifecycle_state="available",
             tags={"Environment": "prod", "Owner": "team-a"},
-            region="us-east-1",
-            created_at=created_at,
         )
 
         assert efs.file_system_id == "fs-12345678"
-        assert efs.arn == "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678"
+        assert efs.arn == EFS_ARN
         assert efs.encryption_enabled is True
         assert efs.kms_key_id == "arn:aws:kms:us-east-1:123456789012:key/abcd1234-5678-90ab-cdef-1234567890ab"
         assert efs.performance_mode == "generalPurpose"
         assert efs.lifecycle_state == "available"
         assert efs.tags == {"Environment": "prod", "Owner": "team-a"}
         assert efs.region == "us-east-1"
-        assert efs.created_at == created_at
+        assert efs.created_at == frozen_utc
 
-    def test_create_unencrypted_efs(self) -> None:
+    def test_create_unencrypted_efs(self, make_efs: MakeEFS) -> None:
         """Test creating an unencrypted EFS file system (no KMS key)."""
-        efs = EFSFileSystem(
+        efs = make_efs(
             file_system_id="fs-87654321",
             arn="arn:aws:elasticfilesystem:us-west-2:123456789012:file-system/fs-87654321",
             encryption_enabled=False,
-            kms_key_id=None,
             performance_mode="maxIO",
-            lifecycle_state="available",
-            tags={},
             region="us-west-2",
-            created_at=datetime.now(timezone.utc),
         )
 
         assert efs.encryption_enabled is False
         assert efs.kms_key_id is None
         assert efs.performance_mode == "maxIO"
 
-    def test_validate_file_system_id_format(self) -> None:
-        """Test that file system ID validation enforces fs-* format."""
-        efs = EFSFileSystem(
-            file_system_id="invalid-id",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=True,
-            kms_key_id=None,
-            performance_mode="generalPurpose",
-            lifecycle_state="available",
-            tags={},
-            region="us-east-1",
-            created_at=datetime.now(timezone.utc),
-        )
-
-        with pytest.raises(ValueError, match="Invalid file_system_id format"):
+    @pytest.mark.parametrize(
+        "field,value,expected_error",
+        [
+            pytest.param("file_system_id", "invalid-id", INVALID_FS_ID_RE, id="file_system_id"),
+            pytest.param("performance_mode", "invalid-mode", INVALID_PERFORMANCE_MODE_RE, id="performance_mode"),
+            pytest.param("lifecycle_state", "invalid-state", INVALID_LIFECYCLE_STATE_RE, id="lifecycle_state"),
+        ],
+    )
+    def test_validate_invalid_field(
+        self, make_efs: MakeEFS, field: str, value: str, expected_error: re.Pattern[str]
+    ) -> None:
+        """Test that an invalid file_system_id, performance_mode or lifecycle_state is rejected."""
+        efs = make_efs(**{field: value})
+
+        with pytest.raises(ValueError, match=expected_error):
             efs.validate()
 
-    def test_validate_valid_file_system_id(self) -> None:
+    def test_validate_valid_file_system_id(self, make_efs: MakeEFS) -> None:
         """Test validation passes for valid fs-* format."""
-        efs = EFSFileSystem(
+        efs = make_efs(
             file_system_id="fs-abcdef123456",
             arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-abcdef123456",
-            encryption_enabled=True,
-            kms_key_id=None,
-            performance_mode="generalPurpose",
-            lifecycle_state="available",
-            tags={},
-            region="us-east-1",
-            created_at=datetime.now(timezone.utc),
         )
 
         assert efs.validate() is True
 
-    def test_validate_performance_mode(self) -> None:
-        """Test that performance_mode must be generalPurpose or maxIO."""
-        efs = EFSFileSystem(
-            file_system_id="fs-12345678",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=True,
-            kms_key_id=None,
-            performance_mode="invalid-mode",
-            lifecycle_state="available",
-            tags={},
-            region="us-east-1",
-            created_at=datetime.now(timezone.utc),
-        )
-
-        with pytest.raises(ValueError, match="Invalid performance_mode"):
-            efs.validate()
+    @pytest.mark.parametrize("state", ["available", "creating", "deleting", "deleted"])
+    def test_validate_lifecycle_state(self, make_efs: MakeEFS, state: str) -> None:
+        """Test that every valid lifecycle_state passes validation."""
+        efs = make_efs(lifecycle_state=state)
 
-    def test_validate_lifecycle_state(self) -> None:
-        """Test that lifecycle_state validation works."""
-        valid_states = ["available", "creating", "deleting", "deleted"]
-
-        for state in valid_states:
-            efs = EFSFileSystem(
-                file_system_id="fs-12345678",
-                arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-                encryption_enabled=True,
-                kms_key_id=None,
-                performance_mode="generalPurpose",
-                lifecycle_state=state,
-                tags={},
-                region="us-east-1",
-                created_at=datetime.now(timezone.utc),
-            )
-            assert efs.validate() is True
-
-    def test_validate_invalid_lifecycle_state(self) -> None:
-        """Test that invalid lifecycle_state raises error."""
-        efs = EFSFileSystem(
-            file_system_id="fs-12345678",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=True,
-            kms_key_id=None,
-            performance_mode="generalPurpose",
-            lifecycle_state="invalid-state",
-            tags={},
-            region="us-east-1",
-            created_at=datetime.now(timezone.utc),
-        )
-
-        with pytest.raises(ValueError, match="Invalid lifecycle_state"):
-            efs.validate()
+        assert efs.validate() is True
 
-    def test_encryption_with_kms_key(self) -> None:
+    def test_encryption_with_kms_key(self, make_efs: MakeEFS) -> None:
         """Test validation passes when encryption enabled with KMS key."""
-        efs = EFSFileSystem(
-            file_system_id="fs-12345678",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=True,
-            kms_key_id="arn:aws:kms:us-east-1:123456789012:key/abcd1234",
-            performance_mode="generalPurpose",
-            lifecycle_state="available",
-            tags={},
-            region="us-east-1",
-            created_at=datetime.now(timezone.utc),
-        )
+        efs = make_efs(kms_key_id="arn:aws:kms:us-east-1:123456789012:key/abcd1234")
 
         assert efs.validate() is True
 
-    def test_to_resource_dict(self) -> None:
+    def test_to_resource_dict(self, make_efs: MakeEFS) -> None:
         """Test conversion to Resource-compatible dictionary."""
         created_at = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
-        efs = EFSFileSystem(
-            file_system_id="fs-12345678",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=True,
+        efs = make_efs(
             kms_key_id="arn:aws:kms:us-east-1:123456789012:key/abcd1234",
-            performance_mode="generalPurpose",
-            lifecycle_state="available",
             tags={"Environment": "prod"},
-            region="us-east-1",
             created_at=created_at,
         )
 
         resource_dict = efs.to_resource_dict()
 
-        assert resource_dict["arn"] == "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678"
+        assert resource_dict["arn"] == EFS_ARN
         assert resource_dict["resource_type"] == "efs:file-system"
         assert resource_dict["name"] == "fs-12345678"
         assert resource_dict["region"] == "us-east-1"
@@ -184,19 +117,9 @@ class TestEFSFileSystem:
         assert resource_dict["raw_config"]["encryption_enabled"] is True
         assert resource_dict["raw_config"]["performance_mode"] == "generalPurpose"
 
-    def test_to_resource_dict_with_empty_tags(self) -> None:
+    def test_to_resource_dict_with_empty_tags(self, make_efs: MakeEFS) -> None:
         """Test to_resource_dict with no tags."""
-        efs = EFSFileSystem(
-            file_system_id="fs-12345678",
-            arn="arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-12345678",
-            encryption_enabled=False,
-            kms_key_id=None,
-            performance_mode="generalPurpose",
-            lifecycle_state="available",
-            tags={},
-            region="us-east-1",
-            created_at=datetime.now(timezone.utc),
-        )
+        efs = make_efs(encryption_enabled=False)
 
         resource_dict = efs.to_resource_dict()
         assert resource_dict["tags"] == {}
@@ -5,10 +5,68 @@ Test coverage for protection rule configuration with type-specific patterns.
 
 from __future__ import annotations
 
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
 import pytest
 
 from src.models.protection_rule import ProtectionRule, RuleType
 
+# Validation error messages, compiled once for pytest.raises(match=...)
+AGE_NEEDS_THRESHOLD_RE = re.compile(r"age rule requires positive threshold")
+COST_NEEDS_THRESHOLD_RE = re.compile(r"cost rule requires positive threshold")
+NEEDS_THRESHOLD_RE = re.compile(r"requires positive threshold")
+EMPTY_PATTERNS_RE = re.compile(r"Patterns cannot be empty")
+PRIORITY_RANGE_RE = re.compile(r"Priority must be 1-100")
+
+# Shared tag rule inputs; read-only so no test can change them for the others
+TAG_RULE_PATTERNS: Mapping[str, Any] = MappingProxyType(
+    {"tag_key": "Protection", "tag_values": ("true", "critical"), "match_mode": "exact"}
+)
+PROTECTED_TAG_RESOURCE: Mapping[str, Any] = MappingProxyType(
+    {"resource_id": "i-001", "tags": MappingProxyType({"Protection": "true", "Environment": "prod"})}
+)
+
+# (rule_type, patterns, threshold_value, matching resource, non-matching resources) per rule type
+MATCH_CASES = [
+    pytest.param(
+        RuleType.TAG,
+        TAG_RULE_PATTERNS,
+        None,
+        PROTECTED_TAG_RESOURCE,
+        [
+            {"resource_id": "i-002", "tags": {"Protection": "false"}},
+            {"resource_id": "i-003", "tags": {"Environment": "dev"}},  # Missing tag
+        ],
+        id="tag",
+    ),
+    pytest.param(
+        RuleType.TYPE,
+        {"resource_types": ["AWS::IAM::Role", "AWS::KMS::Key"]},
+        None,
+        {"resource_id": "role-admin", "resource_type": "AWS::IAM::Role"},
+        [{"resource_id": "i-001", "resource_type": "AWS::EC2::Instance"}],
+        id="type",
+    ),
+    pytest.param(
+        RuleType.AGE,
+        {"environment": "production"},
+        30.0,
+        {"resource_id": "i-001", "age_days": 15},  # Too young (protected)
+        [{"resource_id": "i-002", "age_days": 45}],  # Old enough (not protected)
+        id="age",
+    ),
+    pytest.param(
+        RuleType.COST,
+        {"action": "block"},
+        5000.0,
+        {"resource_id": "db-prod", "estimated_monthly_cost": 6000.0},  # High cost (protected)
+        [{"resource_id": "i-test", "estimated_monthly_cost": 10.0}],  # Low cost (not protected)
+        id="cost",
+    ),
+]
+
 
 class TestProtectionRule:
     """Test suite for ProtectionRule model."""
@@ -51,6 +109,42 @@ class TestProtectionRule:
         assert rule.rule_type == RuleType.TYPE
         assert "AWS::IAM::Role" in rule.patterns["resource_types"]
 
+    def test_list_patterns_stored_as_frozensets(self) -> None:
+        """Test value-list patterns become frozensets without changing the caller's dict."""
+        patterns = {"tag_key": "Protection", "tag_values": ["true", "critical"]}
+
+        rule = ProtectionRule(rule_id="rule_set", rule_type=RuleType.TAG, enabled=True, priority=1, patterns=patterns)
+
+        assert rule.patterns["tag_values"] == frozenset({"true", "critical"})
+        assert rule.patterns["tag_key"] == "Protection"
+        assert patterns["tag_values"] == ["true", "critical"]
+
+    def test_string_tag_values_is_one_value(self) -> None:
+        """Test a string tag_values is kept as one value, not split into characters."""
+        rule = ProtectionRule(
+            rule_id="rule_str",
+            rule_type=RuleType.TAG,
+            enabled=True,
+            priority=1,
+            patterns={"tag_key": "Protection", "tag_values": "true"},
+        )
+
+        assert rule.patterns["tag_values"] == frozenset({"true"})
+        assert rule.matches({"resource_id": "i-001", "tags": {"Protection": "true"}}) is True
+        assert rule.matches({"resource_id": "i-002", "tags": {"Protection": "t"}}) is False
+
+    def test_non_collection_patterns_kept_as_given(self) -> None:
+        """Test a None value pattern is left alone instead of failing construction."""
+        rule = ProtectionRule(
+            rule_id="rule_none",
+            rule_type=RuleType.TAG,
+            enabled=True,
+            priority=1,
+            patterns={"tag_key": "Protection", "tag_values": None},
+        )
+
+        assert rule.patterns["tag_values"] is None
+
     def test_create_age_rule(self) -> None:
         """Test creating age-based protection rule."""
         rule = ProtectionRule(
@@ -110,7 +204,7 @@ class TestProtectionRule:
             # Missing threshold_value!
         )
 
-        with pytest.raises(ValueError, match="age rule requires positive threshold"):
+        with pytest.raises(ValueError, match=AGE_NEEDS_THRESHOLD_RE):
             rule.validate()
 
     def test_validate_cost_rule_requires_threshold(self) -> None:
@@ -124,7 +218,7 @@ class TestProtectionRule:
             # Missing threshold_value!
         )
 
-        with pytest.raises(ValueError, match="cost rule requires positive threshold"):
+        with pytest.raises(ValueError, match=COST_NEEDS_THRESHOLD_RE):
             rule.validate()
 
     def test_validate_negative_threshold_raises_error(self) -> None:
@@ -138,7 +232,7 @@ class TestProtectionRule:
             threshold_value=-10.0,  # Invalid!
         )
 
-        with pytest.raises(ValueError, match="requires positive threshold"):
+        with pytest.raises(ValueError, match=NEEDS_THRESHOLD_RE):
             rule.validate()
 
     def test_validate_empty_patterns_raises_error(self) -> None:
@@ -151,7 +245,7 @@ class TestProtectionRule:
             patterns={},  # Empty!
         )
 
-        with pytest.raises(ValueError, match="Patterns cannot be empty"):
+        with pytest.raises(ValueError, match=EMPTY_PATTERNS_RE):
             rule.validate()
 
     def test_validate_priority_range(self) -> None:
@@ -164,7 +258,7 @@ class TestProtectionRule:
             patterns={"tag_key": "Test"},
         )
 
-        with pytest.raises(ValueError, match="Priority must be 1-100"):
+        with pytest.raises(ValueError, match=PRIORITY_RANGE_RE):
             rule_low.validate()
 
         rule_high = ProtectionRule(
@@ -175,7 +269,7 @@ class TestProtectionRule:
             patterns={"tag_key": "Test"},
         )
 
-        with pytest.raises(ValueError, match="Priority must be 1-100"):
+        with pytest.raises(ValueError, match=PRIORITY_RANGE_RE):
             rule_high.validate()
 
     def test_validate_valid_priority_range(self) -> None:
@@ -198,116 +292,40 @@ class TestProtectionRule:
         )
         assert rule_max.validate() is True
 
-    def test_matches_tag_rule(self) -> None:
-        """Test tag rule matching logic."""
+    @pytest.mark.parametrize("rule_type,patterns,threshold,matching,non_matching", MATCH_CASES)
+    def test_matches_rule(
+        self,
+        rule_type: RuleType,
+        patterns: Mapping[str, Any],
+        threshold: Optional[float],
+        matching: Mapping[str, Any],
+        non_matching: List[Dict[str, Any]],
+    ) -> None:
+        """Test each rule type matches its protected resource and none of the others."""
         rule = ProtectionRule(
-            rule_id="rule_tag",
-            rule_type=RuleType.TAG,
+            rule_id=f"rule_{rule_type.value}",
+            rule_type=rule_type,
             enabled=True,
             priority=1,
-            patterns={
-                "tag_key": "Protection",
-                "tag_values": ["true", "critical"],
-                "match_mode": "exact",
-            },
+            patterns=dict(patterns),
+            threshold_value=threshold,
         )
 
-        # Should match
-        protected_resource = {
-            "resource_id": "i-001",
-            "tags": {"Protection": "true", "Environment": "prod"},
-        }
-        assert rule.matches(protected_resource) is True
-
-        # Should not match
-        unprotected_resource = {
-            "resource_id": "i-002",
-            "tags": {"Protection": "false"},
-        }
-        assert rule.matches(unprotected_resource) is False
-
-        # Missing tag
-        no_tag_resource = {
-            "resource_id": "i-003",
-            "tags": {"Environment": "dev"},
-        }
-        assert rule.matches(no_tag_resource) is False
-
-    def test_matches_type_rule(self) -> None:
-        """Test type rule matching logic."""
-        rule = ProtectionRule(
-            rule_id="rule_type",
-            rule_type=RuleType.TYPE,
-            enabled=True,
-            priority=1,
-            patterns={
-                "resource_types": ["AWS::IAM::Role", "AWS::KMS::Key"],
-            },
-        )
+        assert rule.matches(matching) is True
+        for resource in non_matching:
+            assert rule.matches(resource) is False
 
-        # Should match
-        iam_resource = {
-            "resource_id": "role-admin",
-            "resource_type": "AWS::IAM::Role",
-        }
-        assert rule.matches(iam_resource) is True
-
-        # Should not match
-        ec2_resource = {
-            "resource_id": "i-001",
-            "resource_type": "AWS::EC2::Instance",
-        }
-        assert rule.matches(ec2_resource) is False
-
-    def test_matches_age_rule(self) -> None:
-        """Test age rule matching logic."""
+    def test_matches_native_rule_always_false(self) -> None:
+        """Test native rules are not evaluated by matches()."""
         rule = ProtectionRule(
-            rule_id="rule_age",
-            rule_type=RuleType.AGE,
-            enabled=True,
-            priority=1,
-            patterns={"environment": "production"},
-            threshold_value=30.0,
-        )
-
-        # Too young (protected)
-        young_resource = {
-            "resource_id": "i-001",
-            "age_days": 15,
-        }
-        assert rule.matches(young_resource) is True
-
-        # Old enough (not protected)
-        old_resource = {
-            "resource_id": "i-002",
-            "age_days": 45,
-        }
-        assert rule.matches(old_resource) is False
-
-    def test_matches_cost_rule(self) -> None:
-        """Test cost rule matching logic."""
-        rule = ProtectionRule(
-            rule_id="rule_cost",
-            rule_type=RuleType.COST,
+            rule_id="rule_native",
+            rule_type=RuleType.NATIVE,
             enabled=True,
             priority=1,
-            patterns={"action": "block"},
-            threshold_value=5000.0,
+            patterns={"protection_types": ["ec2_termination_protection"]},
         )
 
-        # High cost (protected)
-        expensive_resource = {
-            "resource_id": "db-prod",
-            "estimated_monthly_cost": 6000.0,
-        }
-        assert rule.matches(expensive_resource) is True
-
-        # Low cost (not protected)
-        cheap_resource = {
-            "resource_id": "i-test",
-            "estimated_monthly_cost": 10.0,
-        }
-        assert rule.matches(cheap_resource) is False
+        assert rule.matches(PROTECTED_TAG_RESOURCE) is False
 
     def test_matches_disabled_rule_always_false(self) -> None:
         """Test disabled rule never matches."""
@@ -316,19 +334,11 @@ class TestProtectionRule:
             rule_type=RuleType.TAG,
             enabled=False,  # Disabled!
             priority=1,
-            patterns={
-                "tag_key": "Protection",
-                "tag_values": ["true"],
-            },
+            patterns=dict(TAG_RULE_PATTERNS),
         )
 
-        resource = {
-            "resource_id": "i-001",
-            "tags": {"Protection": "true"},
-        }
-
         # Even though it matches pattern, disabled rule returns False
-        assert rule.matches(resource) is False
+        assert rule.matches(PROTECTED_TAG_RESOURCE) is False
 
 
 class TestRuleType:
@@ -256,6 +256,103 @@ class TestSafetyChecker:
         assert matching_rules[0].rule_id == "rule_001"
         assert matching_rules[1].rule_id == "rule_002"
 
+    def test_priority_order_across_tag_and_other_rules(self) -> None:
+        """Test indexed TAG rules and other rules are still ranked by priority together."""
+        rules = [
+            ProtectionRule(
+                rule_id="rule_tag_low",
+                rule_type=RuleType.TAG,
+                enabled=True,
+                priority=3,
+                patterns={"tag_key": "Protection", "tag_values": ["true", "critical"]},
+            ),
+            ProtectionRule(
+                rule_id="rule_type_high",
+                rule_type=RuleType.TYPE,
+                enabled=True,
+                priority=1,
+                patterns={"resource_types": ["AWS::EC2::Instance"]},
+            ),
+            ProtectionRule(
+                rule_id="rule_tag_mid",
+                rule_type=RuleType.TAG,
+                enabled=True,
+                priority=2,
+                patterns={"tag_key": "Owner", "tag_values": ["team-a"]},
+            ),
+            ProtectionRule(
+                rule_id="rule_tag_other_value",
+                rule_type=RuleType.TAG,
+                enabled=True,
+                priority=4,
+                patterns={"tag_key": "Protection", "tag_values": ["false"]},
+            ),
+        ]
+
+        checker = SafetyChecker(rules=rules)
+        resource = {
+            "resource_id": "i-001",
+            "resource_type": "AWS::EC2::Instance",
+            "tags": {"Protection": "critical", "Owner": "team-a"},
+        }
+
+        matching_rules = checker.check_all_protections(resource)
+        is_protected, reason = checker.is_protected(resource)
+
+        assert [rule.rule_id for rule in matching_rules] == ["rule_type_high", "rule_tag_mid", "rule_tag_low"]
+        assert is_protected is True
+        assert reason is not None and "rule_type_high" in reason
+
+        # Without the type match, the highest-priority TAG rule wins
+        resource["resource_type"] = "AWS::S3::Bucket"
+        is_protected, reason = checker.is_protected(resource)
+
+        assert is_protected is True
+        assert reason is not None and "rule_tag_mid" in reason
+
+    def test_resource_with_tags_none(self) -> None:
+        """Test a resource whose tags are None is still checked against the other rules."""
+        type_rule = ProtectionRule(
+            rule_id="rule_type",
+            rule_type=RuleType.TYPE,
+            enabled=True,
+            priority=1,
+            patterns={"resource_types": ["AWS::EC2::Instance"]},
+        )
+        tag_rule = ProtectionRule(
+            rule_id="rule_tag",
+            rule_type=RuleType.TAG,
+            enabled=True,
+            priority=2,
+            patterns={"tag_key": "Protection", "tag_values": ["true"]},
+        )
+        resource = {"resource_id": "i-001", "resource_type": "AWS::EC2::Instance", "tags": None}
+
+        for rules in ([type_rule], [type_rule, tag_rule]):
+            checker = SafetyChecker(rules=rules)
+
+            assert checker.is_protected(resource)[0] is True
+            assert [rule.rule_id for rule in checker.check_all_protections(resource)] == ["rule_type"]
+
+    def test_reassigning_rules_rebuilds_tag_index(self) -> None:
+        """Test assigning new rules replaces the indexed TAG rules."""
+        checker = SafetyChecker(rules=[])
+        resource = {"resource_id": "i-001", "tags": {"Protection": "true"}}
+
+        assert checker.is_protected(resource) == (False, None)
+
+        checker.rules = [
+            ProtectionRule(
+                rule_id="rule_tag",
+                rule_type=RuleType.TAG,
+                enabled=True,
+                priority=1,
+                patterns={"tag_key": "Protection", "tag_values": ["true"]},
+            )
+        ]
+
+        assert checker.is_protected(resource)[0] is True
+
     def test_check_all_protections_empty_for_unprotected_resource(self) -> None:
         """Test check_all_protections returns empty list for unprotected resource."""
         rules = [
@@ -0,0 +1,34 @@
+"""Unit tests for configuration hashing utility."""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from src.utils.hash import compute_config_hash
+
+
+class TestComputeConfigHash:
+    """Tests for compute_config_hash function."""
+
+    def test_matches_sorted_json_digest(self):
+        """Test the hash is SHA256 of the key-sorted JSON, so stored hashes stay comparable."""
+        data = {
+            "b": [1, {"y": 2, "x": 1}],
+            "a": "ünïcode",
+            "created": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        }
+
+        expected = hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+        assert compute_config_hash(data) == expected
+
+    def test_key_order_does_not_matter(self):
+        """Test dicts with the same items in a different order hash the same."""
+        assert compute_config_hash({"a": 1, "b": 2}) == compute_config_hash({"b": 2, "a": 1})
+
+    def test_volatile_attributes_ignored(self):
+        """Test excluded attributes do not affect the hash, even when nested."""
+        base = {"Name": "x", "Nested": [{"Id": 1}]}
+        volatile = {"Name": "x", "State": "running", "Nested": [{"Id": 1, "LastModifiedDate": "now"}]}
+
+        assert compute_config_hash(volatile) == compute_config_hash(base)